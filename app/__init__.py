@@ -1,16 +1,17 @@
 
 from apscheduler.schedulers.background import BackgroundScheduler
-from flask import Flask
-from flask_cors import CORS
+from flask import Flask, request
 from flask_jwt_extended import JWTManager
 from flask_mail import Mail
 from flask_sock import Sock
 from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
 from flask_limiter import Limiter
-from flask_limiter.util import get_remote_address
 from app.config import get_config
 from app.config.base import BaseConfig
+from app.config.jsonProvider import OrjsonProvider
+from app.middlewares.cors import handle_preflight, add_cors_headers
+from app.middlewares.errorHandlers import handle_unexpected_error
 from app.middlewares.timestampsValidate import validate_request
 from app.schedulers.checkUnusedChargers import init_check_chargers
 
@@ -22,6 +23,12 @@ sock: Sock = Sock()
 scheduler: BackgroundScheduler = BackgroundScheduler()
 
 
+def _rate_limit_key() -> str:
+    """Klucz limitera zapytań - adres IP klienta pobrany bezpośrednio ze środowiska WSGI."""
+
+    return request.environ.get("REMOTE_ADDR") or "127.0.0.1"
+
+
 def create_app() -> Flask:
     """
     Tworzy i konfiguruje aplikację Flask.
@@ -34,33 +41,37 @@ def create_app() -> Flask:
 
     app: Flask = Flask(__name__, static_folder='attachments', static_url_path='/attachments')
     app.config.from_object(get_config())
+    app.json = OrjsonProvider(app)
 
-    limiter = Limiter(app = app, key_func=get_remote_address, default_limits=["200000 per day", "50000 per hour"])
-
+    limiter = Limiter(app=app, key_func=_rate_limit_key, default_limits=["200000 per day", "50000 per hour"],
+                      storage_uri="memory://", strategy="fixed-window")
 
     mail.init_app(app)
 
     BaseConfig.configure_database(app, db)
 
-    jwt.init_app(app)
-    CORS(app)
+    app.before_request(handle_preflight)
+    app.after_request(add_cors_headers)
 
     migrate.init_app(app, db)
     sock.init_app(app)
 
-    BaseConfig.configure_jwt(app)
+    BaseConfig.configure_jwt(app, jwt)
+
+    app.before_request(validate_request)
+    app.register_error_handler(Exception, handle_unexpected_error)
+    app.limiter = limiter
 
+    # Import tras tworzy singletony serwisów (app.services), które wczytują dane z bazy - wymaga kontekstu aplikacji.
     with app.app_context():
         from app.routes import register_blueprints
 
-        app.before_request(validate_request)
-        app.limiter = limiter
-        init_check_chargers(scheduler)
-
+        register_blueprints(app)
 
-    if not scheduler.running:
+    # Scheduler działa w jednym procesie - przy wielu workerach WSGI zmienną RUN_SCHEDULER=1
+    # ustawia się tylko dla jednego z nich, aby zadania nie wykonywały się N razy.
+    if app.config.get("RUN_SCHEDULER") and not scheduler.running:
+        init_check_chargers(scheduler)
         scheduler.start()
 
-    register_blueprints(app)
-
     return app
@@ -1,29 +1,35 @@
 import os
+from functools import lru_cache
+
 from dotenv import load_dotenv
 
 BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../"))
 
-load_dotenv(os.path.join(BASE_DIR, ".env"))
+# W produkcji zmienne środowiskowe są ustawione przez środowisko uruchomieniowe - plik .env nie jest parsowany.
+if os.getenv("FLASK_ENV") != "production" and os.getenv("SKIP_DOTENV") != "1":
+    load_dotenv(os.path.join(BASE_DIR, ".env"), override=False)
+
+FLASK_ENV: str = os.getenv("FLASK_ENV", "development")
 
 
+@lru_cache(maxsize=1)
 def get_config():
     """
     Określa i zwraca odpowiednią konfigurację.
 
     Funkcja sprawdza zmienną środowiskową FLASK_ENV, aby zdecydować, której konfiguracji użyć.
     Jeśli FLASK_ENV nie jest ustawione, domyślnie używa 'development'.
+    Wynik jest zapamiętywany, więc wybór konfiguracji odbywa się raz na proces.
 
     :return: Odpowiednia klasa konfiguracji.
     """
 
-    env: str = os.getenv("FLASK_ENV", "development")
-
-    if env == "production":
+    if FLASK_ENV == "production":
         from app.config.production import ProductionConfig
         return ProductionConfig
-    elif env == "testing":
+    elif FLASK_ENV == "testing":
         from app.config.testing import TestingConfig
         return TestingConfig
     else:
         from app.config.development import DevelopmentConfig
-        return DevelopmentConfig
\ No newline at end of file
+        return DevelopmentConfig
@@ -1,43 +1,138 @@
 import os
+import sqlite3
+from typing import Any, Callable
 
 from flask_sqlalchemy import SQLAlchemy
 from sqlalchemy import event
+from sqlalchemy.engine import Engine
 from flask import jsonify, Flask
 from flask_jwt_extended import JWTManager
 
+_ENV: dict[str, str] = dict(os.environ)
+
+# Ustawienia czytane ze zmiennych środowiskowych: atrybut -> (zmienna, wartość domyślna)
+_ENV_SETTINGS: dict[str, tuple[str, str]] = {
+    'SECRET_KEY': ('SECRET_KEY', 'example'),
+    'SQLALCHEMY_DATABASE_URI': ('DATABASE_URL', 'sqlite:///example.db'),
+    'JWT_SECRET_KEY': ('JWT_SECRET_KEY', 'example'),
+    'REQUEST_HMAC_KEY': ('REQUEST_HMAC_KEY', ''),
+    'MAIL_USERNAME': ('MAIL_USERNAME', 'MAIL'),
+    'MAIL_PASSWORD': ('MAIL_PASSWORD', 'PASS'),
+    'MAIL_DEFAULT_SENDER': ('MAIL_DEFAULT_SENDER', 'MAIL'),
+    'AI_API_KEY': ('AI_API_KEY', 'KEY'),
+    'DB_PRE_PING': ('DB_PRE_PING', '0'),
+    'DB_POOL': ('DB_POOL', '20'),
+    'DB_OVERFLOW': ('DB_OVERFLOW', '40'),
+    'RUN_SCHEDULER': ('RUN_SCHEDULER', '0'),
+    'USE_XACCEL': ('USE_XACCEL', '0'),
+    'XACCEL_PREFIX': ('XACCEL_PREFIX', '/_protected/'),
+}
+
+# Konwersje ustawień, które nie są tekstem: atrybut -> funkcja zamieniająca wartość zmiennej
+_ENV_PARSERS: dict[str, Callable[[str], Any]] = {
+    'DB_PRE_PING': lambda value: value == '1',
+    'DB_POOL': int,
+    'DB_OVERFLOW': int,
+    'RUN_SCHEDULER': lambda value: value == '1',
+    'USE_XACCEL': lambda value: value == '1',
+}
+
+
+def _setting(name: str) -> Any:
+    """Zwraca wartość ustawienia z migawki zmiennych środowiskowych, przekonwertowaną według ``_ENV_PARSERS``."""
+    key, default = _ENV_SETTINGS[name]
+    value: str = _ENV.get(key, default)
+    parser: Callable[[str], Any] | None = _ENV_PARSERS.get(name)
+    return parser(value) if parser else value
+
+
+def _engine_options() -> dict[str, int | bool]:
+    """Buduje opcje silnika SQLAlchemy na podstawie bieżących ustawień puli połączeń."""
+    return {
+        'pool_recycle': 280,
+        'pool_pre_ping': _setting('DB_PRE_PING'),
+        'pool_timeout': 20,
+        'pool_size': _setting('DB_POOL'),
+        'max_overflow': _setting('DB_OVERFLOW'),
+        'pool_use_lifo': True
+    }
+
+
+@event.listens_for(Engine, 'connect')
+def _configure_connection(dbapi_con, con_record) -> None:
+    """
+    Ustawia parametry sesji dla każdego nowego połączenia z bazą danych.
+
+    Listener jest rejestrowany raz, na klasie ``Engine``, więc obejmuje wszystkie silniki
+    bez tworzenia ich w kontekście aplikacji. Rodzaj bazy rozpoznawany jest po sterowniku.
+    """
+
+    if isinstance(dbapi_con, sqlite3.Connection):
+        dbapi_con.execute('pragma foreign_keys=ON')
+    elif type(dbapi_con).__module__.startswith('pymysql'):
+        cursor = dbapi_con.cursor()
+        cursor.execute('SET FOREIGN_KEY_CHECKS=0')
+        cursor.execute('SET SESSION wait_timeout=200')
+        cursor.close()
+
 
 class BaseConfig:
     """
     Klasa służąca do przechowywania i konfigurowania podstawowych ustawień aplikacji.
     """
 
-    SECRET_KEY: str = os.getenv('SECRET_KEY', 'example')
+    SECRET_KEY: str = _setting('SECRET_KEY')
 
-    SQLALCHEMY_DATABASE_URI: str = os.getenv('DATABASE_URL', 'sqlite:///example.db')
+    SQLALCHEMY_DATABASE_URI: str = _setting('SQLALCHEMY_DATABASE_URI')
     SQLALCHEMY_TRACK_MODIFICATIONS: bool = False
 
-    SQLALCHEMY_ENGINE_OPTIONS: dict[str, int | bool] = {
-        'pool_recycle': 280,
-        'pool_pre_ping': True,
-        'pool_timeout': 20
-    }
+    # pool_pre_ping dodaje zapytanie testowe przy każdym pobraniu połączenia z puli, dlatego jest opcjonalne
+    # (DB_PRE_PING=1). Zerwane połączenia lepiej wykrywać po stronie bazy/systemu - pool_recycle poniżej
+    # wait_timeout MySQL lub tcp_keepalives_idle w PostgreSQL.
+    SQLALCHEMY_ENGINE_OPTIONS: dict[str, int | bool] = _engine_options()
 
-    JWT_SECRET_KEY: str = os.getenv('JWT_SECRET_KEY', 'example')
+    JWT_SECRET_KEY: str = _setting('JWT_SECRET_KEY')
     JWT_ACCESS_TOKEN_EXPIRES: int = 2592000  # 1h
     JWT_REFRESH_TOKEN_EXPIRES: int = 2592000  # 30d
     JWT_ALGORITHM: str = "HS256"
 
+    REQUEST_HMAC_KEY: str = _setting('REQUEST_HMAC_KEY')
+
     MAIL_SERVER: str = 'smtp.gmail.com'
     MAIL_PORT: int = 465
     MAIL_USE_TLS: bool = False
     MAIL_USE_SSL: bool = True
-    MAIL_USERNAME: str = os.getenv('MAIL_USERNAME', 'MAIL')
-    MAIL_PASSWORD: str = os.getenv('MAIL_PASSWORD', 'PASS')
-    MAIL_DEFAULT_SENDER: str = os.getenv('MAIL_DEFAULT_SENDER', 'MAIL')
+    MAIL_USERNAME: str = _setting('MAIL_USERNAME')
+    MAIL_PASSWORD: str = _setting('MAIL_PASSWORD')
+    MAIL_DEFAULT_SENDER: str = _setting('MAIL_DEFAULT_SENDER')
 
     UPLOAD_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'uploads')
 
-    AI_API_KEY: str = os.getenv('AI_API_KEY', 'KEY')
+    AI_API_KEY: str = _setting('AI_API_KEY')
+
+    RUN_SCHEDULER: bool = _setting('RUN_SCHEDULER')
+
+    # Przy USE_XACCEL=1 pliki statyczne wysyła nginx (nagłówek X-Accel-Redirect), a nie worker WSGI.
+    # Lokalizacja XACCEL_PREFIX musi być w nginx oznaczona jako internal i wskazywać na katalog attachments.
+    USE_XACCEL: bool = _setting('USE_XACCEL')
+    XACCEL_PREFIX: str = _setting('XACCEL_PREFIX')
+
+    @classmethod
+    def reload_env(cls) -> None:
+        """
+        Ponownie wczytuje zmienne środowiskowe i odświeża zależne od nich ustawienia.
+
+        Przydatne w testach, które modyfikują ``os.environ`` po zaimportowaniu konfiguracji.
+        """
+
+        _ENV.clear()
+        _ENV.update(os.environ)
+
+        for name in _ENV_SETTINGS:
+            if hasattr(cls, name):
+                setattr(cls, name, _setting(name))
+
+        cls.SQLALCHEMY_ENGINE_OPTIONS = _engine_options()
 
     @staticmethod
     def configure_database(app: Flask, db: SQLAlchemy) -> None:
@@ -50,34 +145,18 @@ class BaseConfig:
 
         db.init_app(app)
 
-        if app.config['SQLALCHEMY_DATABASE_URI'].startswith('mysql'):
-            def configure_mysql_connection(dbapi_con, con_record):
-                cursor = dbapi_con.cursor()
-                cursor.execute('SET FOREIGN_KEY_CHECKS=0')
-                cursor.execute('SET SESSION wait_timeout=200')
-                cursor.close()
-
-            with app.app_context():
-                event.listen(db.engine, 'connect', configure_mysql_connection)
-
-        elif app.config['SQLALCHEMY_DATABASE_URI'].startswith('sqlite'):
-            def _fk_pragma_on_connect(dbapi_con, con_record):
-                dbapi_con.execute('pragma foreign_keys=ON')
-
-            with app.app_context():
-                event.listen(db.engine, 'connect', _fk_pragma_on_connect)
-
     @staticmethod
-    def configure_jwt(app: Flask) -> JWTManager:
+    def configure_jwt(app: Flask, jwt: JWTManager) -> JWTManager:
         """
         Konfiguruje uwierzytelnianie JWT dla aplikacji Flask.
 
         :param app: Instancja aplikacji Flask.
+        :param jwt: Współdzielona instancja JWTManager.
 
         :return: Zainicjowana instancja JWTManager.
         """
 
-        jwt: JWTManager = JWTManager(app)
+        jwt.init_app(app)
 
         @jwt.unauthorized_loader
         def custom_unauthorized_response(callback):
@@ -0,0 +1,60 @@
+import dataclasses
+import decimal
+import uuid
+from datetime import date, time
+from typing import Any
+
+import orjson
+from flask import Response
+from flask.json.provider import JSONProvider
+from werkzeug.http import http_date
+
+_DUMPS_OPTIONS: int = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+
+def _default(obj: Any) -> Any:
+    """
+    Serializuje typy nieobsługiwane natywnie przez orjson, tak samo jak domyślny provider Flaska.
+    """
+
+    if isinstance(obj, date):
+        return http_date(obj)
+    if isinstance(obj, time):
+        return obj.isoformat()
+    if isinstance(obj, (decimal.Decimal, uuid.UUID)):
+        return str(obj)
+    if dataclasses.is_dataclass(obj):
+        return dataclasses.asdict(obj)
+    if hasattr(obj, "__html__"):
+        return str(obj.__html__())
+
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """
+    Serializuje obiekt do JSON (bytes) z tymi samymi opcjami, których używa ``OrjsonProvider``.
+    """
+
+    return orjson.dumps(obj, default=_default, option=_DUMPS_OPTIONS)
+
+
+class OrjsonProvider(JSONProvider):
+    """
+    Provider JSON dla Flaska oparty na orjson.
+
+    Używany przez ``jsonify`` oraz ``request.get_json``. Daty serializowane są jak w domyślnym
+    providerze Flaska (format HTTP), a ``Decimal`` jako tekst.
+    """
+
+    mimetype: str = "application/json"
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return dumps_bytes(obj).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(dumps_bytes(obj), mimetype=self.mimetype)
@@ -0,0 +1,22 @@
+from flask import Response, request
+
+# Stałe nagłówki CORS dołączane do każdej odpowiedzi.
+CORS_HEADERS: dict[str, str] = {
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Methods": "GET, POST, PUT, PATCH, DELETE, OPTIONS",
+    "Access-Control-Allow-Headers": "Authorization, Content-Type, timestamp, X-Signature",
+}
+
+
+def handle_preflight():
+    """Odpowiada na zapytania preflight (OPTIONS) bez przechodzenia przez widoki."""
+
+    if request.method == "OPTIONS":
+        return "", 204
+
+
+def add_cors_headers(response: Response) -> Response:
+    """Dodaje nagłówki CORS do odpowiedzi."""
+
+    response.headers.update(CORS_HEADERS)
+    return response
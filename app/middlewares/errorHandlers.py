@@ -0,0 +1,19 @@
+from flask import Response, current_app
+from werkzeug.exceptions import HTTPException
+
+from app.routes.decorators.errorResponse import error_response
+
+
+def handle_unexpected_error(error: Exception) -> HTTPException | tuple[Response, int]:
+    """
+    Obsługuje wyjątki nieprzechwycone w widokach.
+
+    Wyjątki HTTP (np. 404, 405) zwracane są bez zmian. Pozostałe wyjątki są logowane, a klient otrzymuje
+    ogólny komunikat błędu bez szczegółów wewnętrznych.
+    """
+
+    if isinstance(error, HTTPException):
+        return error
+
+    current_app.logger.exception(error)
+    return error_response("Wystąpił błąd serwera", 500)
@@ -1,27 +1,58 @@
 import time
 import hmac
-from flask import request, jsonify
+import hashlib
+from functools import lru_cache
+from flask import request, jsonify, current_app
+
+# Ścieżki zwolnione z walidacji timestampu (websockety oraz symulacja stacji).
+EXEMPT_PATH_PREFIXES: tuple[str, ...] = ("/ws", "/station/scan-qr")
+MAX_TIMESTAMP_DRIFT: int = 30
+
+_time = time.time
 
 
 def validate_request():
     """Globalna walidacja Timestampu. Anty atak Reply."""
 
-    if request.method == "OPTIONS":
-        return None
-
-    if "ws" or "scan-qr" in request.url:
+    if request.method == "OPTIONS" or request.path.startswith(EXEMPT_PATH_PREFIXES):
         return None
 
-    timestamp = request.headers.get("timestamp")
+    timestamp = request.environ.get("HTTP_TIMESTAMP")
     if not timestamp:
         return jsonify({"error": "Brak timestampu"}), 403
 
     try:
-        timestamp = int(timestamp)
-    except ValueError:
+        if abs(int(_time()) - int(timestamp)) > MAX_TIMESTAMP_DRIFT:
+            return jsonify({"error": "Niepoprawny timestamp"}), 403
+    except (TypeError, ValueError):
         return jsonify({"error": "Niepoprawny format timestampu"}), 403
 
-    current_time = int(time.time())
+    secret: str = current_app.config.get("REQUEST_HMAC_KEY")
+    if secret and not verify_signature(secret.encode(), timestamp):
+        return jsonify({"error": "Niepoprawny podpis żądania"}), 403
+
+
+@lru_cache(maxsize=4)
+def _hmac_prototype(secret: bytes) -> hmac.HMAC:
+    """Zwraca obiekt HMAC z już przetworzonym kluczem - kopiowany dla każdego żądania."""
+
+    return hmac.new(secret, digestmod=hashlib.sha256)
+
+
+def verify_signature(secret: bytes, timestamp: str) -> bool:
+    """
+    Weryfikuje podpis HMAC-SHA256 żądania.
+
+    Podpis liczony jest z timestampu oraz treści żądania i przesyłany w nagłówku ``X-Signature``
+    jako ciąg szesnastkowy. Porównanie odbywa się w czasie stałym.
+
+    :param secret: Klucz HMAC.
+    :param timestamp: Timestamp z nagłówka żądania.
+
+    :return: True, jeśli podpis jest poprawny.
+    """
 
-    if abs(current_time - timestamp) > 30:
-        return jsonify({"error": "Niepoprawny timestamp"}), 403
+    mac: hmac.HMAC = _hmac_prototype(secret).copy()
+    mac.update(timestamp.encode())
+    mac.update(request.get_data(cache=True))
+    return hmac.compare_digest(mac.hexdigest(), request.environ.get("HTTP_X_SIGNATURE", ""))
@@ -0,0 +1,16 @@
+from time import time_ns
+
+from sqlalchemy import Enum
+
+# Typy wyliczeniowe współdzielone przez kilka modeli - jedna instancja typu na całe metadane.
+CONNECTOR_TYPE: Enum = Enum('Type1', 'Type2', 'CCS', 'CHAdeMO', 'Tesla NACS', name='connector_types')
+PORT_STATUS: Enum = Enum('Available', 'InUse', 'Faulty', 'Maintenance', name='port_status')
+
+
+def now_ms() -> int:
+    """
+    Zwraca aktualny czas jako unix timestamp w milisekundach.
+
+    Używane jako wartość domyślna kolumn ``created_on``/``started_on`` itp.
+    """
+    return time_ns() // 1_000_000
@@ -15,7 +15,7 @@ class Attachment(db.Model):
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     path = db.Column(db.Text, nullable=False)
 
-    users = relationship("User", back_populates="avatar", foreign_keys="[User.avatar_id]")
+    users = relationship("User", back_populates="avatar", foreign_keys="[User.avatar_id]", lazy="raise")
 
     def __init__(self, id, path):
         self.id = id
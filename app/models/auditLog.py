@@ -1,6 +1,5 @@
-from datetime import datetime
-
 from app import db
+from app.models import now_ms
 
 
 class AuditLog(db.Model):
@@ -17,10 +16,10 @@ class AuditLog(db.Model):
     __tablename__ = "audit_logs"
 
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
-    user_id = db.Column(db.Integer, nullable=False)
-    action = db.Column(db.String(255), nullable=False)
+    user_id = db.Column(db.Integer, nullable=False, index=True)
+    action = db.Column(db.String(255), nullable=False, index=True)
     details = db.Column(db.JSON, nullable=True)
-    created_on = db.Column(db.BigInteger, nullable=False, default=lambda: int(datetime.utcnow().timestamp() * 1000))
+    created_on = db.Column(db.BigInteger, nullable=False, default=now_ms)
 
     def __init__(self, id, user_id, action, details=None, created_on=None):
         self.id = id
@@ -1,7 +1,8 @@
 from sqlalchemy import BigInteger
 
 from app import db
-from datetime import datetime
+from app.models import now_ms, CONNECTOR_TYPE
+
 
 class Car(db.Model):
     """
@@ -22,15 +23,15 @@ class Car(db.Model):
     __tablename__ = "cars"
 
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
-    owner_id = db.Column(db.Integer, nullable=False)
+    owner_id = db.Column(db.Integer, nullable=False, index=True)
     plate = db.Column(db.String(20), unique=True, nullable=False)
     name = db.Column(db.String(100), nullable=False)
-    battery_capacity = db.Column(db.DECIMAL(5, 2), nullable=False)
-    max_charging_power = db.Column(db.DECIMAL(5, 2), nullable=False)
-    connector_type = db.Column(db.Enum('Type1', 'Type2', 'CCS', 'CHAdeMO', 'Tesla NACS', name='connector_types'), nullable=False)
+    battery_capacity = db.Column(db.DECIMAL(5, 2, asdecimal=False), nullable=False)
+    max_charging_power = db.Column(db.DECIMAL(5, 2, asdecimal=False), nullable=False)
+    connector_type = db.Column(CONNECTOR_TYPE, nullable=False)
     country_code = db.Column(db.String(2), nullable=True)
     year = db.Column(db.Integer, nullable=False)
-    registered_on = db.Column(db.BigInteger, nullable=False, default=lambda: int(datetime.utcnow().timestamp() * 1000))
+    registered_on = db.Column(db.BigInteger, nullable=False, default=now_ms)
 
     def __init__(self, id: int, owner_id: int, plate: str, name: str, 
                  battery_capacity: float, max_charging_power: float, 
@@ -1,6 +1,5 @@
-from datetime import datetime
-
 from app import db
+from app.models import now_ms
 
 
 class ChargingSession(db.Model):
@@ -25,11 +24,11 @@ class ChargingSession(db.Model):
     user_id = db.Column(db.Integer, nullable=False)
     port_id = db.Column(db.Integer, nullable=False)
     car_id = db.Column(db.Integer, nullable=True)
-    started_on = db.Column(db.BigInteger, nullable=False, default=lambda: int(datetime.utcnow().timestamp() * 1000))
+    started_on = db.Column(db.BigInteger, nullable=False, default=now_ms)
     end_on = db.Column(db.BigInteger, nullable=True)
-    energy_consumed = db.Column(db.DECIMAL(10, 2), nullable=True)
-    power_limit = db.Column(db.DECIMAL(5, 2), nullable=True)
-    cost = db.Column(db.DECIMAL(10, 2), nullable=True)
+    energy_consumed = db.Column(db.DECIMAL(10, 2, asdecimal=False), nullable=True)
+    power_limit = db.Column(db.DECIMAL(5, 2, asdecimal=False), nullable=True)
+    cost = db.Column(db.DECIMAL(10, 2, asdecimal=False), nullable=True)
 
     def __init__(self, id, user_id, port_id, car_id, started_on=None, end_on=None, energy_consumed=None, power_limit=None, cost=None):
         self.id = id
@@ -1,7 +1,7 @@
 from sqlalchemy import BigInteger
 
 from app import db
-from datetime import datetime
+from app.models import now_ms
 
 
 class Discount(db.Model):
@@ -20,7 +20,7 @@ class Discount(db.Model):
 
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     code = db.Column(db.String(50), nullable=False, unique=True)
-    value = db.Column(db.DECIMAL(5, 2), nullable=False)
+    value = db.Column(db.DECIMAL(5, 2, asdecimal=False), nullable=False)
     expiry_on = db.Column(db.BigInteger, nullable=True)
     usage_count = db.Column(db.Integer, nullable=False, default=0)
     max_uses = db.Column(db.Integer, nullable=True)
@@ -34,9 +34,8 @@ class Discount(db.Model):
         self.usage_count = usage_count
 
     def is_valid(self) -> bool:
-        current_timestamp = int(datetime.utcnow().timestamp() * 1000)
-        if self.expiry_on and current_timestamp > self.expiry_on:
-            return False
         if self.max_uses is not None and self.usage_count >= self.max_uses:
             return False
+        if self.expiry_on and now_ms() > self.expiry_on:
+            return False
         return True
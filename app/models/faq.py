@@ -1,6 +1,5 @@
-from datetime import datetime
-
 from app import db
+from app.models import now_ms
 
 
 class Faq(db.Model):
@@ -20,9 +19,9 @@ class Faq(db.Model):
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     question = db.Column(db.Text, nullable=False)
     answer = db.Column(db.Text, nullable=False)
-    user_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False, index=True)
     public = db.Column(db.Boolean, nullable=False, default=False)
-    created_on = db.Column(db.BigInteger, nullable=False, default=lambda: int(datetime.utcnow().timestamp() * 1000))
+    created_on = db.Column(db.BigInteger, nullable=False, default=now_ms)
 
     def __init__(self, id: int, question: str, answer: str,public: bool,user_id: int, created_on=None):
         self.id = id
@@ -7,11 +7,15 @@ class PDF(FPDF):
     """
     Klasa przechowująca ustawienia PDF
     """
+    _FONTS: dict[str, str] = {
+        "": r"attachments/fonts/MonaSans.ttf",
+        "B": r"attachments/fonts/MonaSans-Bold.ttf"
+    }
+
     def __init__(self):
         super().__init__()
-        attachment_service: AttachmentsService = AttachmentsService()
-        self.add_font("MonaSans", "", attachment_service.get_file_path(r"attachments/fonts/MonaSans.ttf"), uni=True)
-        self.add_font("MonaSans", "B", attachment_service.get_file_path(r"attachments/fonts/MonaSans-Bold.ttf"), uni=True)
+        for style, path in self._FONTS.items():
+            self.add_font("MonaSans", style, AttachmentsService.get_file_path(path), uni=True)
 
 class ReportPDF(PDF):
     def __init__(self, header: str, generated_by: str, generated_on: str, from_date: str, to_date: str):
@@ -42,7 +46,6 @@ class InvoicePDF(PDF):
 
     def __init__(self, header: str, generated_on: str, buyer: User):
         super().__init__()
-        self.attachment_service: AttachmentsService = AttachmentsService()
         self._header = header
         self._first_name = buyer.first_name
         self._last_name = buyer.last_name
@@ -54,7 +57,7 @@ class InvoicePDF(PDF):
 
     def header(self):
         self.image(
-            self.attachment_service.get_file_path(r"attachments/logo_b.png"),
+            AttachmentsService.get_file_path(r"attachments/logo_b.png"),
             x=Align.L, w=33, h=28, alt_text=self._SELLER_NAME
         )
         self.ln(10)
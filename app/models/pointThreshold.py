@@ -1,7 +1,7 @@
 from sqlalchemy import BigInteger
 
 from app import db
-from datetime import datetime
+from app.models import now_ms
 
 
 class PointThreshold(db.Model):
@@ -21,9 +21,9 @@ class PointThreshold(db.Model):
 
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     points_required = db.Column(db.Integer, nullable=False)
-    discount_value = db.Column(db.DECIMAL(5, 2), nullable=False)
+    discount_value = db.Column(db.DECIMAL(5, 2, asdecimal=False), nullable=False)
     description = db.Column(db.String(255))
-    created_on = db.Column(db.BigInteger, nullable=False, default=lambda: int(datetime.utcnow().timestamp() * 1000))
+    created_on = db.Column(db.BigInteger, nullable=False, default=now_ms)
     is_active = db.Column(db.Boolean, default=True)
 
     def __init__(self, id: int, points_required: int, discount_value: float, description: str = None,
@@ -1,4 +1,5 @@
 from app import db
+from app.models import CONNECTOR_TYPE, PORT_STATUS
 
 
 class Port(db.Model):
@@ -16,11 +17,9 @@ class Port(db.Model):
 
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     station_id = db.Column(db.Integer, db.ForeignKey('stations.id'), nullable=False)
-    max_power = db.Column(db.DECIMAL(5, 2), nullable=False)
-    connector_type = db.Column(db.Enum('Type1', 'Type2', 'CCS', 'CHAdeMO', 'Tesla NACS', 
-                                     name='connector_types'), nullable=False)
-    status = db.Column(db.Enum('Available', 'InUse', 'Faulty', 'Maintenance', 
-                              name='port_status'), nullable=False)
+    max_power = db.Column(db.DECIMAL(5, 2, asdecimal=False), nullable=False)
+    connector_type = db.Column(CONNECTOR_TYPE, nullable=False)
+    status = db.Column(PORT_STATUS, nullable=False)
 
     def __init__(self, id, station_id, max_power, connector_type, status='Available'):
         self.id = id
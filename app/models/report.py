@@ -1,6 +1,5 @@
-from datetime import datetime
-
 from app import db
+from app.models import now_ms
 
 
 class Report(db.Model):
@@ -17,9 +16,9 @@ class Report(db.Model):
     __tablename__ = "reports"
 
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
-    generated_by = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
+    generated_by = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False, index=True)
     type = db.Column(db.Enum('Usage', 'Cost', 'Statistics', 'Invoice', name='report_types'), nullable=False)
-    generated_on = db.Column(db.BigInteger, nullable=False, default=lambda: int(datetime.utcnow().timestamp() * 1000))
+    generated_on = db.Column(db.BigInteger, nullable=False, default=now_ms)
     pdf_id = db.Column(db.Integer, nullable=False)
 
     def __init__(self, id, generated_by, type, pdf_id, generated_on=None):
@@ -21,15 +21,15 @@ class Station(db.Model):
 
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     name = db.Column(db.String(100), nullable=False)
-    lat = db.Column(db.DECIMAL(10, 8), nullable=False)
-    lng = db.Column(db.DECIMAL(11, 8), nullable=False)
+    lat = db.Column(db.DECIMAL(10, 8, asdecimal=False), nullable=False)
+    lng = db.Column(db.DECIMAL(11, 8, asdecimal=False), nullable=False)
     address = db.Column(db.String(255), nullable=False)
     image_url = db.Column(db.String(500), nullable=True)
     status = db.Column(db.Enum('active', 'inactive', "maintenance", name='station_status'), nullable=False,
                        default='active')
     opening_time = db.Column(db.Time, nullable=False)
     closing_time = db.Column(db.Time, nullable=False)
-    price_per_kwh = db.Column(db.DECIMAL(10, 2), nullable=False)
+    price_per_kwh = db.Column(db.DECIMAL(10, 2, asdecimal=False), nullable=False)
 
     def __init__(self, id, name, lat, lng, address, status='active', opening_time=None, closing_time=None,
                  price_per_kwh=None, image_url=None):
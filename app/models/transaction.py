@@ -1,6 +1,5 @@
 from app import db
-from datetime import datetime
-
+from app.models import now_ms
 
 class Transaction(db.Model):
     """
@@ -21,9 +20,9 @@ class Transaction(db.Model):
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
     station_id = db.Column(db.Integer, db.ForeignKey('stations.id'), nullable=True)
     car_id = db.Column(db.Integer, db.ForeignKey('cars.id'), nullable=True)
-    amount = db.Column(db.DECIMAL(10, 2), nullable=False)
+    amount = db.Column(db.DECIMAL(10, 2, asdecimal=False), nullable=False)
     type = db.Column(db.Enum('TopUp', 'Payment', 'Refund', name='transaction_types'), nullable=False)
-    created_on = db.Column(db.BigInteger, nullable=False, default=lambda: int(datetime.utcnow().timestamp() * 1000))
+    created_on = db.Column(db.BigInteger, nullable=False, default=now_ms)
 
     def __init__(self, id: int, user_id: int, station_id: int, car_id: int, amount: float, type: str, created_on=None):
         self.id = id
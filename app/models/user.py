@@ -1,8 +1,7 @@
-from datetime import datetime
-
 from sqlalchemy.orm import relationship
 
 from app import db
+from app.models import now_ms
 
 
 class User(db.Model):
@@ -40,8 +39,8 @@ class User(db.Model):
     email = db.Column(db.String(100), unique=True, nullable=False)
     phone_number = db.Column(db.String(15))
     role = db.Column(db.Enum('admin', 'client', name='user_roles'), nullable=False, default='client')
-    balance = db.Column(db.DECIMAL(10, 2), nullable=False, default=0.00)
-    registered_on = db.Column(db.BigInteger, nullable=False, default=lambda: int(datetime.utcnow().timestamp() * 1000))
+    balance = db.Column(db.DECIMAL(10, 2, asdecimal=False), nullable=False, default=0.00)
+    registered_on = db.Column(db.BigInteger, nullable=False, default=now_ms)
     address_line1 = db.Column(db.String(100))
     city = db.Column(db.String(50))
     postal_code = db.Column(db.String(10))
@@ -51,7 +50,7 @@ class User(db.Model):
     gender = db.Column(db.Enum('male', 'female', 'other', name='gender_types'))
     avatar_id = db.Column(db.Integer, db.ForeignKey('attachments.id', ondelete='SET NULL'))
 
-    avatar = relationship("Attachment", foreign_keys=[avatar_id])
+    avatar = relationship("Attachment", foreign_keys=[avatar_id], back_populates="users", lazy="raise")
 
     status = db.Column(db.Enum('active', 'inactive', 'suspended', name='user_status'), default='active')
 
@@ -59,29 +58,5 @@ class User(db.Model):
 
     points = db.Column(db.Integer, default=0)
 
-    def __init__(self, id, first_name, last_name, email, password, role='client', phone_number=None,
-                 address_line1=None, city=None, postal_code=None, country=None,
-                 date_of_birth=None, gender=None, avatar_id=None, status='active',
-                 two_factor_enabled=False, balance=0.00, registered_on=None, points=0):
-        self.id = id
-        self.first_name = first_name
-        self.last_name = last_name
-        self.email = email
-        self.password = password
-        self.role = role
-        self.phone_number = phone_number
-        self.balance = balance
-        self.address_line1 = address_line1
-        self.city = city
-        self.postal_code = postal_code
-        self.country = country
-        self.date_of_birth = date_of_birth
-        self.gender = gender
-        self.avatar_id = avatar_id
-        self.status = status
-        self.two_factor_enabled = two_factor_enabled
-        self.registered_on = registered_on
-        self.points = points
-
     def __repr__(self):
         return f"<User(id={self.id}, email={self.email}, role={self.role}, status={self.status})>"
\ No newline at end of file
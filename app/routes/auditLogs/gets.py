@@ -1,20 +1,22 @@
-from typing import Any
-
 from flask import Blueprint, jsonify, request, Response
-from flask_jwt_extended import jwt_required, get_jwt_identity
+from flask_jwt_extended import jwt_required
 
 from app.models.auditLog import AuditLog
+from app.routes.decorators.currentIdentity import current_identity
 from app.routes.decorators.pagination import paginate
-from app.services import UsersService
-from app.services.auditLogService import AuditLogsService
+from app.routes.decorators.serializer import make_serializer
+from app.services import audit_logs_service
 
 gets_logs_blueprint: Blueprint = Blueprint("gets_logs", __name__, url_prefix="/logs")
 
 
+_log_to_dict = make_serializer(("id", "user_id", "action", "details", "created_on"))
+
+
 @gets_logs_blueprint.route("/get-all", methods=["GET"])
 @jwt_required()
-@paginate
-def get_logs() -> tuple[Response, int] | list[dict[str, Any]] | list[dict[str, Any]]:
+@paginate(serializer=_log_to_dict)
+def get_logs() -> tuple[Response, int] | list[AuditLog]:
     """
     Pobiera logi audytowe.
 
@@ -37,11 +39,7 @@ def get_logs() -> tuple[Response, int] | list[dict[str, Any]] | list[dict[str, A
     - ``500`` **Internal Server Error**: Jeśli wystąpił błąd serwera.
     """
 
-    audit_logs_service: AuditLogsService = AuditLogsService()
-    users_service: UsersService = UsersService()
-
-    user_id: int = int(get_jwt_identity())
-    is_admin: bool = users_service.get(user_id).role == 'admin'
+    user_id, is_admin = current_identity()
 
     log_id: int = request.args.get('id', type=int)
     action: str = request.args.get('action', type=str)
@@ -55,16 +53,11 @@ def get_logs() -> tuple[Response, int] | list[dict[str, Any]] | list[dict[str, A
             if not is_admin and log.user_id != user_id:
                 return jsonify({"error": "Brak dostępu do tego logu"}), 403
 
-            return [{
-                "id": log.id,
-                "user_id": log.user_id,
-                "action": log.action,
-                "details": log.details,
-                "created_on": log.created_on
-            }]
+            return [log]
 
         if action:
-            logs: list[AuditLog] = audit_logs_service.get_by_action(action)
+            logs: list[AuditLog] = audit_logs_service.get_by_action(action) if is_admin \
+                else audit_logs_service.get_by_action_and_user(action, user_id)
         elif target_user_id:
             if not is_admin and target_user_id != user_id:
                 return jsonify({"error": "Brak dostępu do logów tego użytkownika"}), 403
@@ -73,19 +66,7 @@ def get_logs() -> tuple[Response, int] | list[dict[str, Any]] | list[dict[str, A
         else:
             logs: list[AuditLog] = audit_logs_service.get_all() if is_admin else audit_logs_service.get_by_user(user_id)
 
-        if not is_admin:
-            logs = [log for log in logs if log.user_id == user_id]
-
-        return [
-            {
-                "id": log.id,
-                "user_id": log.user_id,
-                "action": log.action,
-                "details": log.details,
-                "created_on": log.created_on
-            }
-            for log in logs
-        ]
+        return logs
 
     except Exception as e:
         return jsonify({"error": str(e)}), 500
\ No newline at end of file
@@ -1,4 +1,4 @@
-from flask import Blueprint, send_file, jsonify
+from flask import Blueprint, Response, jsonify, stream_with_context
 from flask_jwt_extended import jwt_required
 from app.routes.decorators.adminRequired import admin_required
 from app.services.backupService import BackupService
@@ -17,14 +17,18 @@ def create_backup():
     Url zapytania: ``/backup/create``
 
     Obsługuje żądania POST do tworzenia backupu bazy danych. Użytkownik musi być uwierzytelniony za pomocą JWT
-    i posiadać uprawnienia administratora.
+    i posiadać uprawnienia administratora. Backup jest przesyłany strumieniowo, w miarę odczytu tabel.
 
     Zwraca:\n
     - ``200`` **OK**: Jeśli backup został pomyślnie utworzony, zwraca plik backupu.\n
     - ``500`` **Internal Server Error**: Jeśli wystąpił błąd serwera.
     """
     try:
-        backup_data = BackupService.create_backup()
-        return send_file(backup_data, as_attachment=True), 200
+        backup_stream = BackupService.stream_backup()
+        return Response(
+            stream_with_context(backup_stream),
+            mimetype="application/sql",
+            headers={"Content-Disposition": "attachment; filename=backup.sql"}
+        ), 200
     except Exception as e:
         return jsonify({"error": str(e)}), 500
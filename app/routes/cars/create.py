@@ -1,8 +1,10 @@
-from flask import Blueprint, request, jsonify, Response
+from flask import Blueprint, jsonify, Response
 from flask_jwt_extended import jwt_required, get_jwt_identity
 
 from app.models.car import Car
-from app.services.carService import CarsService
+from app.routes.cars.schema import parse_car_payload
+from app.routes.decorators.requestJson import load_json
+from app.services import cars_service
 
 create_cars_blueprint: Blueprint = Blueprint("create_cars", __name__, url_prefix="/cars")
 
@@ -35,16 +37,12 @@ def create_car() -> tuple[Response, int]:
     - ``500`` **Internal Server Error**: Jeśli wystąpił błąd serwera.
     """
 
-    cars_service: CarsService = CarsService()
     try:
-        data = request.get_json()
-
-        required_fields: list[str] = ["plate", "name", "battery_capacity", "max_charging_power", "connector_type",
-                           "year", "country_code"]
-
-        if not data or not all(field in data for field in required_fields):
-            return jsonify({"error": f"Nieprawidłowe dane żądania. Wymagane pola: {', '.join(required_fields)}"}), 400
+        data = parse_car_payload(load_json())
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
 
+    try:
         owner_id: int = int(get_jwt_identity())
         plate: str = data["plate"].strip().upper()
         name: str  = data["name"].strip()
@@ -65,8 +63,8 @@ def create_car() -> tuple[Response, int]:
             "owner_id": car.owner_id,
             "plate": car.plate,
             "name": car.name,
-            "battery_capacity": str(car.battery_capacity),
-            "max_charging_power": str(car.max_charging_power),
+            "battery_capacity": f"{car.battery_capacity:.2f}",
+            "max_charging_power": f"{car.max_charging_power:.2f}",
             "connector_type": car.connector_type,
             "year": car.year,
             "country_code": car.country_code,
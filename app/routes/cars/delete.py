@@ -1,9 +1,9 @@
 from flask import Blueprint, jsonify, Response
-from flask_jwt_extended import jwt_required, get_jwt_identity
+from flask_jwt_extended import jwt_required
 
 from app.models.car import Car
-from app.services.carService import CarsService
-from app.services.userService import UsersService
+from app.routes.decorators.currentIdentity import current_identity
+from app.services import cars_service
 
 delete_cars_blueprint: Blueprint = Blueprint('delete_cars', __name__, url_prefix="/cars")
 
@@ -32,11 +32,7 @@ def delete_car(car_id) -> tuple[Response, int]:
     """
 
     try:
-        users_service: UsersService = UsersService()
-        cars_service: CarsService = CarsService()
-
-        user_id: int = int(get_jwt_identity())
-        is_admin: bool = users_service.get(user_id).role == 'admin'
+        user_id, is_admin = current_identity()
 
         car: Car = cars_service.get(car_id)
         if not car:
@@ -1,20 +1,67 @@
 import os
+import re
+from functools import lru_cache
 
-from flask import Blueprint, jsonify, Response, send_file
+from flask import Blueprint, jsonify, Response, send_file, current_app
 from flask_jwt_extended import jwt_required, get_jwt_identity
 
 from app.models.car import Car
+from app.routes.decorators.currentIdentity import current_identity
 from app.routes.decorators.pagination import paginate
-from app.services import UsersService, AttachmentsService
-from app.services.carService import CarsService
+from app.routes.decorators.serializer import make_serializer
+from app.services import AttachmentsService, cars_service
 
 gets_cars_blueprint: Blueprint = Blueprint("gets_cars", __name__, url_prefix="/cars")
 
+CAR_BRANDS: tuple[str, ...] = ("bmw", "audi", "mercedes", "toyota", "honda", "ford", "tesla")
+_BRAND_RE: re.Pattern = re.compile("|".join(CAR_BRANDS))
+
+
+@lru_cache(maxsize=1)
+def _brand_images() -> tuple[dict[str, str], str]:
+    """
+    Zwraca ścieżki obrazów marek, które istnieją na dysku, oraz ścieżkę obrazu domyślnego.
+
+    Istnienie plików sprawdzane jest raz na proces, przy pierwszym zapytaniu.
+    """
+
+    paths: dict[str, str] = {}
+    for brand in CAR_BRANDS:
+        image_path: str = AttachmentsService.get_file_path(f"attachments/cars/{brand}.png")
+        if os.path.exists(image_path):
+            paths[brand] = image_path
+
+    return paths, AttachmentsService.get_file_path("attachments/cars/unknown.png")
+
+
+def _decimal_to_str(value) -> str | None:
+    return f"{value:.2f}" if value else None
+
+
+_car_to_dict = make_serializer(
+    ("id", "owner_id", "plate", "name", "battery_capacity", "max_charging_power", "connector_type", "year",
+     "registered_on", "country_code"),
+    {"battery_capacity": _decimal_to_str, "max_charging_power": _decimal_to_str}
+)
+
+
+def _send_car_image(image_path: str) -> Response:
+    """
+    Wysyła obraz samochodu - przez nginx (X-Accel-Redirect), jeśli jest włączony, w przeciwnym razie przez send_file.
+    """
+
+    if current_app.config.get("USE_XACCEL"):
+        response: Response = Response(mimetype="image/png")
+        response.headers["X-Accel-Redirect"] = f"{current_app.config['XACCEL_PREFIX']}cars/{os.path.basename(image_path)}"
+        return response
+
+    return send_file(image_path)
+
 
 @gets_cars_blueprint.route("/get-all", methods=["GET"])
 @jwt_required()
-@paginate
-def get_all_cars() -> list[dict[str, str | int | float | None]]:
+@paginate(serializer=_car_to_dict)
+def get_all_cars() -> list[Car]:
     """
     Pobiera wszystkie samochody.
 
@@ -30,27 +77,11 @@ def get_all_cars() -> list[dict[str, str | int | float | None]]:
     - ``500`` **Internal Server Error**: Jeśli wystąpił błąd serwera.
     """
 
-    users_service: UsersService = UsersService()
-    user_id: int = int(get_jwt_identity())
-    is_admin: bool = users_service.get(user_id).role == 'admin'
-
-    cars: list[Car] = CarsService().get_all() if is_admin else CarsService().get_by_owner(user_id)
-
-    return [
-        {
-            "id": car.id,
-            "owner_id": car.owner_id,
-            "plate": car.plate,
-            "name": car.name,
-            "battery_capacity": str(car.battery_capacity) if car.battery_capacity else None,
-            "max_charging_power": str(car.max_charging_power) if car.max_charging_power else None,
-            "connector_type": car.connector_type,
-            "year": car.year,
-            "registered_on": car.registered_on,
-            "country_code": car.country_code
-        }
-        for car in cars
-    ]
+    user_id, is_admin = current_identity()
+
+    cars: list[Car] = cars_service.get_all() if is_admin else cars_service.get_by_owner(user_id)
+
+    return cars
 
 
 @gets_cars_blueprint.route("get/<int:car_id>", methods=["GET"])
@@ -74,31 +105,17 @@ def get_car(car_id) -> dict[str, str | int | float | None] | tuple[Response, int
     - ``500`` **Internal Server Error**: Jeśli wystąpił błąd serwera.
     """
 
-    cars_service: CarsService = CarsService()
     car: Car = cars_service.get(car_id)
     if not car:
         return jsonify({"error": "Samochód nie istnieje"}), 404
 
-    car_data = {
-        "id": car.id,
-        "owner_id": car.owner_id,
-        "plate": car.plate,
-        "name": car.name,
-        "battery_capacity": str(car.battery_capacity) if car.battery_capacity else None,
-        "max_charging_power": str(car.max_charging_power) if car.max_charging_power else None,
-        "connector_type": car.connector_type,
-        "year": car.year,
-        "registered_on": car.registered_on,
-        "country_code": car.country_code
-    }
-
-    return jsonify(car_data), 200
+    return jsonify(_car_to_dict(car)), 200
 
 
 @gets_cars_blueprint.route("get/self", methods=["GET"])
 @jwt_required()
-@paginate
-def get_self_cars() -> list[dict[str, str | int | float | None]]:
+@paginate(serializer=_car_to_dict)
+def get_self_cars() -> list[Car]:
 
     """
     Pobiera swoje samochody użytkownika.
@@ -111,25 +128,10 @@ def get_self_cars() -> list[dict[str, str | int | float | None]]:
     - ``500`` **Internal Server Error**: Jeśli wystąpił błąd serwera.
     """
 
-    cars_service: CarsService = CarsService()
     user_id: int = int(get_jwt_identity())
     cars: list[Car] = cars_service.get_by_owner(user_id)
 
-    return [
-        {
-            "id": car.id,
-            "owner_id": car.owner_id,
-            "plate": car.plate,
-            "name": car.name,
-            "battery_capacity": str(car.battery_capacity) if car.battery_capacity else None,
-            "max_charging_power": str(car.max_charging_power) if car.max_charging_power else None,
-            "connector_type": car.connector_type,
-            "year": car.year,
-            "registered_on": car.registered_on,
-            "country_code": car.country_code
-        }
-        for car in cars
-    ]
+    return cars
 
 
 @gets_cars_blueprint.route("/<int:car_id>/image", methods=["GET"])
@@ -150,19 +152,12 @@ def get_car_image(car_id):
     - ``500`` **Internal Server Error**: Jeśli wystąpił błąd serwera.
     """
 
-    car: Car = CarsService().get(car_id)
+    car: Car = cars_service.get(car_id)
 
     if not car:
         return jsonify({"error": "Samochód nie istnieje"}), 404
 
-    car_name: str = car.name.lower()
-    allowed_brands = {"bmw", "audi", "mercedes", "toyota", "honda", "ford", "tesla"}
-    attachment_service: AttachmentsService = AttachmentsService()
-
-    for brand in allowed_brands:
-        if brand in car_name:
-            image_path = attachment_service.get_file_path(f"attachments/cars/{brand}.png")
-            if os.path.exists(image_path):
-                return send_file(image_path), 200
+    brand_paths, unknown_path = _brand_images()
+    match: re.Match | None = _BRAND_RE.search(car.name.lower())
 
-    return send_file(attachment_service.get_file_path("attachments/cars/unknown.png")), 200
+    return _send_car_image(brand_paths.get(match.group(0), unknown_path) if match else unknown_path), 200
@@ -0,0 +1,60 @@
+from typing import Any
+
+from app.models import CONNECTOR_TYPE
+
+# Pola danych samochodu przyjmowane w żądaniach wraz z typem, do którego są konwertowane.
+CAR_FIELDS: dict[str, type] = {
+    "plate": str,
+    "name": str,
+    "battery_capacity": float,
+    "max_charging_power": float,
+    "connector_type": str,
+    "year": int,
+    "country_code": str
+}
+
+NULLABLE_CAR_FIELDS: frozenset[str] = frozenset({"country_code"})
+
+CONNECTOR_TYPES: frozenset[str] = frozenset(CONNECTOR_TYPE.enums)
+
+
+def parse_car_payload(data: Any, partial: bool = False) -> dict[str, Any]:
+    """
+    Waliduje i konwertuje dane samochodu z żądania w jednym przejściu po polach.
+
+    Parametry:\n
+    - ``data`` (Any): Zdekodowane dane JSON żądania.\n
+    - ``partial`` (bool): Jeśli True, wszystkie pola są opcjonalne (aktualizacja).
+
+    Zwraca:\n
+    - ``dict[str, Any]``: Dane zawierające wyłącznie znane pola, po konwersji typów.
+
+    Wyjątki:\n
+    - ``ValueError``: Jeśli brakuje wymaganych pól lub wartości mają niepoprawny format.
+    """
+
+    if not isinstance(data, dict):
+        raise ValueError("Niepoprawny format danych")
+
+    payload: dict[str, Any] = {}
+    for field, field_type in CAR_FIELDS.items():
+        if field not in data:
+            if partial:
+                continue
+            raise ValueError(f"Nieprawidłowe dane żądania. Wymagane pola: {', '.join(CAR_FIELDS)}")
+
+        value = data[field]
+        if value is None and field in NULLABLE_CAR_FIELDS:
+            payload[field] = None
+            continue
+        if field_type is str and not isinstance(value, str):
+            raise ValueError("Niepoprawny format danych")
+        try:
+            payload[field] = field_type(value)
+        except (TypeError, ValueError):
+            raise ValueError("Niepoprawny format danych")
+
+    if "connector_type" in payload and payload["connector_type"] not in CONNECTOR_TYPES:
+        raise ValueError(f"Niepoprawny typ złącza. Dostępne: {', '.join(CONNECTOR_TYPE.enums)}")
+
+    return payload
@@ -1,9 +1,11 @@
-from flask import Blueprint, request, jsonify, Response
-from flask_jwt_extended import jwt_required, get_jwt_identity
+from flask import Blueprint, jsonify, Response
+from flask_jwt_extended import jwt_required
 
 from app.models.car import Car
-from app.services import UsersService
-from app.services.carService import CarsService
+from app.routes.cars.schema import parse_car_payload
+from app.routes.decorators.currentIdentity import current_identity
+from app.routes.decorators.requestJson import load_json
+from app.services import cars_service
 
 update_cars_blueprint: Blueprint = Blueprint('update_cars', __name__, url_prefix="/cars")
 
@@ -42,10 +44,7 @@ def update_car(car_id) -> tuple[Response, int]:
     - ``500`` **Internal Server Error**: Jeśli wystąpił błąd serwera.
     """
 
-    cars_service: CarsService = CarsService()
-    users_service: UsersService = UsersService()
-    user_id: int = int(get_jwt_identity())
-    is_admin: bool = users_service.get(user_id).role == 'admin'
+    user_id, is_admin = current_identity()
 
     car: Car = cars_service.get(car_id)
     if not car:
@@ -53,31 +52,18 @@ def update_car(car_id) -> tuple[Response, int]:
     if not is_admin and car.owner_id != user_id:
         return jsonify({"error": "Brak uprawnień"}), 403
 
-    car_data = request.get_json()
-    if not isinstance(car_data, dict):
-        return jsonify({"error": "Niepoprawny format danych"}), 400
-
-    if "plate" in car_data:
-        existing_car: Car = cars_service.get_by_plate(car_data["plate"])
-        if existing_car and existing_car.id != car_id:
-            return jsonify({"error": "Podany numer rejestracyjny jest już zajęty przez inny samochód"}), 409
-
-    allowed_fields: set[str] = {"plate", "name", "battery_capacity", "max_charging_power", "connector_type", "year",
-                      "country_code"}
-    if not any(field in car_data for field in allowed_fields):
-        return jsonify({"error": "Brak prawidłowych pol do aktualizacji"}), 400
-
     try:
-        if "year" in car_data:
-            car_data["year"] = int(car_data["year"])
+        car_data = parse_car_payload(load_json(), partial=True)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
 
-        if "battery_capacity" in car_data:
-            car_data["battery_capacity"] = float(car_data["battery_capacity"])
+    if not car_data:
+        return jsonify({"error": "Brak prawidłowych pol do aktualizacji"}), 400
 
-        if "max_charging_power" in car_data:
-            car_data["max_charging_power"] = float(car_data["max_charging_power"])
-    except ValueError:
-        return jsonify({"error": "Niepoprawny format danych"}), 400
+    if "plate" in car_data:
+        existing_car_id: int | None = cars_service.get_id_by_plate(car_data["plate"])
+        if existing_car_id is not None and existing_car_id != car_id:
+            return jsonify({"error": "Podany numer rejestracyjny jest już zajęty przez inny samochód"}), 409
 
     updated_car: Car = cars_service.update(car_id, **car_data)
     return jsonify({
@@ -1,10 +1,28 @@
-from flask import Blueprint, jsonify, request, Response
+import time
+
+from flask import Blueprint, jsonify, Response
 from flask_jwt_extended import jwt_required, get_jwt_identity
 
-from app.services import ChargingSessionsService
+from app.config.jsonProvider import dumps_bytes
+from app.routes.decorators.errorResponse import error_response
+from app.routes.decorators.requestJson import load_json
+from app.services import charging_sessions_service
 
 charging_blueprint: Blueprint = Blueprint('charging', __name__, url_prefix="/charging")
 
+# Status sesji odpytywany jest przez klienta co 1-2 s - gotowa odpowiedź JSON trzymana jest w cache przez ten czas.
+STATUS_CACHE_TTL: float = 1.0
+# Maksymalna liczba zapamiętanych odpowiedzi - po przekroczeniu usuwane są wpisy najstarsze.
+STATUS_CACHE_MAX: int = 1024
+_status_cache: dict[int, dict] = {}
+
+
+def _round2(value, default: float | int | None = 0) -> float | int | None:
+    """Zaokrągla wartość liczbową sesji do 2 miejsc po przecinku; dla wartości pustych zwraca ``default``."""
+
+    return round(float(value), 2) if value else default
+
+
 @charging_blueprint.route('/stop', methods=['POST'])
 @jwt_required()
 def stop_charging() -> tuple[Response, int]:
@@ -27,20 +45,21 @@ def stop_charging() -> tuple[Response, int]:
     """
 
     user_id: int = int(get_jwt_identity())
-    data = request.get_json()
+
+    try:
+        data = load_json()
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
 
     session_id: int = data.get('session_id')
 
-    charging_service: ChargingSessionsService = ChargingSessionsService()
-    session = charging_service.get_session_status(session_id)
+    session = charging_sessions_service.get_session_status(session_id)
 
     if not session or session['user_id'] != user_id:
-        return jsonify({
-            'error': 'Nieprawidłowa sesja ładowania'
-        }), 400
+        return error_response('Nieprawidłowa sesja ładowania', 400)
 
     try:
-        success: bool = charging_service.end_charging_session(
+        success: bool = charging_sessions_service.end_charging_session(
             session_id=session_id,
             final_energy=session['current_kwh'],
             final_cost=session['current_cost'],
@@ -48,24 +67,22 @@ def stop_charging() -> tuple[Response, int]:
         )
 
         if not success:
-            return jsonify({
-                'error': 'Nie można zatrzymać ładowania. Sesja mogła już zostać zakończona.'
-            }), 400
+            return error_response('Nie można zatrzymać ładowania. Sesja mogła już zostać zakończona.', 400)
+
+        _status_cache.pop(session_id, None)
 
         return jsonify({
             'message': 'Ładowanie zatrzymane pomyślnie',
             'data': {
                 'session_id': session_id,
-                'final_energy': round(float(session['current_kwh']), 2),
-                'final_cost': round(float(session['current_cost']), 2),
+                'final_energy': _round2(session['current_kwh'], 0.0),
+                'final_cost': _round2(session['current_cost'], 0.0),
                 'end_reason': 'user_stopped'
             }
         }), 200
     except Exception as e:
         print(f"Błąd podczas zatrzymywania ładowania: {str(e)}")
-        return jsonify({
-            'error': 'Wystąpił błąd podczas zatrzymywania ładowania'
-        }), 500
+        return error_response('Wystąpił błąd podczas zatrzymywania ładowania', 500)
 
 
 @charging_blueprint.route('/status/<int:session_id>', methods=['GET'])
@@ -91,38 +108,52 @@ def get_charging_status(session_id) -> tuple[Response, int]:
 
     user_id: int = int(get_jwt_identity())
 
-    charging_service: ChargingSessionsService = ChargingSessionsService()
+    cached: dict | None = _status_cache.get(session_id)
+    if cached:
+        if time.monotonic() >= cached["expiration"]:
+            _status_cache.pop(session_id, None)
+        elif cached["user_id"] == user_id:
+            return Response(cached["body"], mimetype="application/json"), 200
+
     try:
-        session = charging_service.get_session_status(session_id)
+        session = charging_sessions_service.get_session_status(session_id)
 
         if not session or session['user_id'] != user_id:
-            return jsonify({
-                'error': 'Nieprawidłowa sesja ładowania'
-            }), 400
+            return error_response('Nieprawidłowa sesja ładowania', 400)
 
-        return jsonify({
+        current_kwh = session.get('current_kwh')
+        target_kwh = session.get('target_kwh')
+
+        body: bytes = dumps_bytes({
             'data': {
                 'session_id': session_id,
-                'current_kwh': round(float(session['current_kwh']), 2) if session.get('current_kwh') else 0,
-                'charging_power': round(float(session['current_power']), 2) if session.get('current_power') else 0,
-                'current_cost': round(float(session['current_cost']), 2) if session.get('current_cost') else 0,
-                'target_kwh': session.get('target_kwh'),
-                'remaining_kwh': round(float(session['target_kwh'] - session['current_kwh']), 2) if session.get(
-                    'target_kwh') and session.get('current_kwh') else None,
+                'current_kwh': _round2(current_kwh),
+                'charging_power': _round2(session.get('current_power')),
+                'current_cost': _round2(session.get('current_cost')),
+                'target_kwh': target_kwh,
+                'remaining_kwh': round(float(target_kwh - current_kwh), 2) if target_kwh and current_kwh else None,
                 'duration': session.get('duration'),
                 'status': session.get('charging_status', 'unknown'),
                 'price_per_kwh': session.get('price_per_kwh'),
                 'started_on': session.get('started_on'),
-                'car_id': session.get('car_id') if session.get('car_id') else None,
+                'car_id': session.get('car_id') or None,
                 'port_info': {
                     'port_id': session.get('port_id'),
                     'max_power': session.get('max_power'),
                     'connector_type': session.get('connector_type')
                 }
             }
-        }), 200
+        })
+        _status_cache.pop(session_id, None)
+        while len(_status_cache) >= STATUS_CACHE_MAX:
+            _status_cache.pop(next(iter(_status_cache)), None)
+        _status_cache[session_id] = {
+            "user_id": user_id,
+            "body": body,
+            "expiration": time.monotonic() + STATUS_CACHE_TTL
+        }
+
+        return Response(body, mimetype="application/json"), 200
     except Exception as e:
         print(f"Błąd podczas pobierania statusu ładowania: {str(e)}")
-        return jsonify({
-            'error': 'Wystąpił błąd podczas pobierania statusu ładowania'
-        }), 500
+        return error_response('Wystąpił błąd podczas pobierania statusu ładowania', 500)
@@ -1,8 +1,10 @@
-from flask import Blueprint, jsonify, Response
+from flask import Blueprint, Response
 from flask_jwt_extended import jwt_required, get_jwt_identity
 
 from app.models.chargingSession import ChargingSession
-from app.services import ChargingSessionsService
+from app.routes.decorators.errorResponse import error_response
+from app.routes.decorators.jsonResponse import json_response
+from app.services import charging_sessions_service
 
 last_charging_blueprint: Blueprint = Blueprint('last_charging', __name__, url_prefix="/charging")
 
@@ -26,25 +28,17 @@ def get_last_charging() -> tuple[Response, int]:
     """
 
     user_id: int = int(get_jwt_identity())
-    charging_service: ChargingSessionsService = ChargingSessionsService()
 
     try:
-        user_sessions: list[ChargingSession] = charging_service.get_by_user(user_id)
+        last_session: ChargingSession | None = charging_sessions_service.get_last_completed(user_id)
 
-        if not user_sessions:
-            return jsonify({
-                'error': 'Nie znaleziono żadnych sesji ładowania'
-            }), 404
+        if not last_session:
+            if not charging_sessions_service.has_sessions(user_id):
+                return error_response('Nie znaleziono żadnych sesji ładowania', 404)
 
-        completed_sessions: list[ChargingSession] = [s for s in user_sessions if s.end_on is not None]
-        if not completed_sessions:
-            return jsonify({
-                'error': 'Nie znaleziono zakończonych sesji ładowania'
-            }), 404
+            return error_response('Nie znaleziono zakończonych sesji ładowania', 404)
 
-        last_session: ChargingSession = max(completed_sessions, key=lambda x: x.end_on)
-
-        return jsonify({
+        return json_response({
             'data': {
                 'session_id': last_session.id,
                 'started_on': last_session.started_on,
@@ -55,10 +49,8 @@ def get_last_charging() -> tuple[Response, int]:
                 'car_id': last_session.car_id,
                 'power_limit': float(last_session.power_limit) if last_session.power_limit else None
             }
-        }), 200
+        })
 
     except Exception as e:
         print(f"Błąd podczas pobierania ostatniej sesji ładowania: {str(e)}")
-        return jsonify({
-            'error': 'Wystąpił błąd podczas pobierania ostatniej sesji ładowania'
-        }), 500
+        return error_response('Wystąpił błąd podczas pobierania ostatniej sesji ładowania', 500)
@@ -1,9 +1,9 @@
 from functools import wraps
-from flask import jsonify
-from flask_jwt_extended import jwt_required, get_jwt_identity
+from flask_jwt_extended import get_jwt_identity
 
 from app.models.user import User
-from app.services.userService import UsersService
+from app.routes.decorators.errorResponse import error_response
+from app.services import users_service
 
 
 def admin_required(fn):
@@ -11,7 +11,11 @@ def admin_required(fn):
     Dekorator wymagający uprawnień administratora.
 
     Sprawdza, czy użytkownik jest administratorem przed wykonaniem funkcji.
-    Użytkownik musi być uwierzytelniony za pomocą JWT.
+    Użytkownik musi być uwierzytelniony za pomocą JWT - dekorator umieszcza się pod ``@jwt_required()``,
+    który weryfikuje token raz dla całego żądania.
+
+    Rola odczytywana jest z cache współdzielonego serwisu użytkowników, bez zapytania do bazy danych.
+    Zmiana roli lub usunięcie użytkownika aktualizuje cache, więc uprawnienia działają od razu.
 
     Parametry:\n
     - ``fn`` (function): Funkcja do udekorowania.
@@ -22,14 +26,12 @@ def admin_required(fn):
     """
 
     @wraps(fn)
-    @jwt_required()
     def wrapper(*args, **kwargs):
-        users_service: UsersService = UsersService()
         user_id: int = int(get_jwt_identity())
         user: User = users_service.get(user_id)
 
         if not user or user.role != "admin":
-            return jsonify({"error": "Brak uprawnień"}), 403
+            return error_response("Brak uprawnień", 403)
 
         return fn(*args, **kwargs)
 
@@ -0,0 +1,26 @@
+from flask import g
+from flask_jwt_extended import get_jwt_identity
+
+from app.services import users_service
+
+
+def current_identity() -> tuple[int, bool]:
+    """
+    Zwraca identyfikator zalogowanego użytkownika oraz informację, czy jest administratorem.
+
+    Rola odczytywana jest z cache współdzielonego serwisu użytkowników (tak jak w ``admin_required``),
+    więc zmiana roli lub usunięcie użytkownika działa od razu, niezależnie od ważności tokena.
+    Wynik zapamiętywany jest w ``g`` na czas trwania żądania.
+
+    Zwraca:\n
+    - ``tuple[int, bool]``: ID użytkownika oraz flaga administratora.
+    """
+
+    if "current_identity" in g:
+        return g.current_identity
+
+    user_id: int = int(get_jwt_identity())
+    user = users_service.get(user_id)
+
+    g.current_identity = (user_id, bool(user) and user.role == "admin")
+    return g.current_identity
@@ -0,0 +1,27 @@
+from functools import lru_cache
+
+import orjson
+from flask import Response
+
+
+@lru_cache(maxsize=256)
+def _error_body(message: str) -> bytes:
+    return orjson.dumps({"error": message})
+
+
+def error_response(message: str, status: int) -> tuple[Response, int]:
+    """
+    Zwraca odpowiedź błędu ``{"error": message}``.
+
+    Treść JSON dla danego komunikatu serializowana jest raz i trzymana w cache, dlatego funkcja
+    przeznaczona jest dla stałych komunikatów - komunikaty zawierające dane z żądania należy zwracać przez ``jsonify``.
+
+    Parametry:\n
+    - ``message`` (str): Komunikat błędu.\n
+    - ``status`` (int): Kod statusu HTTP.
+
+    Zwraca:\n
+    - ``tuple[Response, int]``: Odpowiedź JSON oraz kod statusu.
+    """
+
+    return Response(_error_body(message), mimetype="application/json"), status
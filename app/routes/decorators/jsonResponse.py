@@ -0,0 +1,23 @@
+from typing import Any
+
+from flask import Response
+
+from app.config.jsonProvider import dumps_bytes
+
+
+def json_response(data: Any, status: int = 200) -> tuple[Response, int]:
+    """
+    Zwraca odpowiedź JSON zbudowaną bezpośrednio z danych zserializowanych przez orjson.
+
+    Pomija pośrednictwo ``jsonify`` (wyszukanie providera w kontekście aplikacji i obsługę argumentów),
+    dlatego przeznaczona jest dla najczęściej odpytywanych endpointów.
+
+    Parametry:\n
+    - ``data`` (Any): Dane odpowiedzi.\n
+    - ``status`` (int): Kod statusu HTTP (domyślnie 200).
+
+    Zwraca:\n
+    - ``tuple[Response, int]``: Odpowiedź JSON oraz kod statusu.
+    """
+
+    return Response(dumps_bytes(data), mimetype="application/json"), status
@@ -1,15 +1,45 @@
+import heapq
 from functools import wraps
-from flask import request, jsonify
+from operator import attrgetter, itemgetter
+from typing import Any, Callable
+from flask import request
+from werkzeug.datastructures import MultiDict
 from math import ceil
 
+from app.routes.decorators.jsonResponse import json_response
 
-def paginate(fn):
+
+MAX_PER_PAGE: int = 100
+
+
+def _parse_pagination(args: MultiDict) -> tuple[int, int, bool]:
+    """
+    Odczytuje parametry paginacji z zapytania.
+
+    Zwraca numer strony (co najmniej 1), liczbę elementów na stronę (od 1 do ``MAX_PER_PAGE``)
+    oraz informację, czy sortowanie jest malejące.
+    """
+
+    page: int = args.get('page', 1, type=int)
+    per_page: int = args.get('per_page', 10, type=int)
+    order: str = args.get('order', 'desc')
+
+    return max(page, 1), min(max(per_page, 1), MAX_PER_PAGE), order.lower() == 'desc'
+
+
+def paginate(fn: Callable = None, *, serializer: Callable[[Any], dict] = None):
     """
     Dekorator paginacji.
 
     Dodaje funkcjonalność paginacji do udekorowanej funkcji. Obsługuje parametry zapytania
     ``page`` i ``per_page`` w celu określenia numeru strony i liczby elementów na stronę.
 
+    Udekorowana funkcja zwraca listę słowników lub - jeśli podano ``serializer`` - listę obiektów.
+    W drugim przypadku serializowane są tylko elementy z żądanej strony.
+
+    Parametry:\n
+    - ``serializer`` (Callable, opcjonalnie): Funkcja zamieniająca obiekt na słownik.
+
     Parametry zapytania:\n
     - ``page`` (int): Numer strony (domyślnie 1).\n
     - ``per_page`` (int): Liczba elementów na stronę (domyślnie 10, maksymalnie 100).
@@ -19,24 +49,19 @@ def paginate(fn):
     - ``200`` **OK**: Wynik paginacji w formacie JSON, zawierający elementy i informacje o paginacji.\n
     - ``500`` **Internal Server Error**: Jeśli wystąpił błąd serwera.
     """
-    
-    @wraps(fn)
-    def wrapper(*args, **kwargs):
-        page: int = request.args.get('page', 1, type=int)
-        per_page: int = request.args.get('per_page', 10, type=int)
-        order: str = request.args.get('order', 'desc', type=str).lower()
 
-        if per_page > 100:
-            per_page = 100
+    if fn is None:
+        return lambda func: paginate(func, serializer=serializer)
 
-        if page < 1:
-            page = 1
+    sort_key: Callable = attrgetter('id') if serializer else itemgetter('id')
+
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        page, per_page, descending = _parse_pagination(request.args)
 
         result = fn(*args, **kwargs)
 
         if isinstance(result, list):
-            reverse_order = order == 'desc'
-            result.sort(key=lambda x: x['id'], reverse=reverse_order)
             total_items: int = len(result)
             total_pages: int = ceil(total_items / per_page)
 
@@ -45,9 +70,15 @@ def paginate(fn):
 
             start_idx: int = (page - 1) * per_page
             end_idx: int = start_idx + per_page
-            paginated_items: list = result[start_idx:end_idx]
 
-            return jsonify({
+            # Sortowana jest tylko część listy potrzebna do wycięcia żądanej strony, a nie cała lista.
+            select_first: Callable = heapq.nlargest if descending else heapq.nsmallest
+            paginated_items: list = select_first(end_idx, result, key=sort_key)[start_idx:]
+
+            if serializer:
+                paginated_items = [serializer(item) for item in paginated_items]
+
+            return json_response({
                 "items": paginated_items,
                 "pagination": {
                     "page": page,
@@ -57,8 +88,8 @@ def paginate(fn):
                     "has_next": page < total_pages,
                     "has_prev": page > 1
                 }
-            }), 200
+            })
 
         return result
 
-    return wrapper
\ No newline at end of file
+    return wrapper
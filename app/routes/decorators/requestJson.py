@@ -0,0 +1,27 @@
+import orjson
+from flask import request
+
+
+def load_json() -> dict:
+    """
+    Dekoduje treść żądania jako obiekt JSON za pomocą orjson.
+
+    Pomija negocjację ``Content-Type`` wykonywaną przez ``request.get_json()`` i nie zapisuje
+    treści w buforze żądania, jeśli nie została już odczytana.
+
+    Zwraca:\n
+    - ``dict``: Zdekodowane dane JSON.
+
+    Wyjątki:\n
+    - ``ValueError``: Jeśli treść żądania nie jest poprawnym obiektem JSON.
+    """
+
+    try:
+        data = orjson.loads(request.get_data(cache=False))
+    except orjson.JSONDecodeError:
+        raise ValueError("Niepoprawny format JSON")
+
+    if not isinstance(data, dict):
+        raise ValueError("Niepoprawny format JSON")
+
+    return data
@@ -0,0 +1,39 @@
+from operator import attrgetter
+from typing import Any, Callable
+
+
+def make_serializer(fields: tuple[str, ...],
+                    converters: dict[str, Callable[[Any], Any]] = None) -> Callable[[Any], dict[str, Any]]:
+    """
+    Tworzy funkcję zamieniającą obiekt modelu na słownik odpowiedzi o stałym zestawie pól.
+
+    Pola odczytywane są jednym wywołaniem ``attrgetter``, więc funkcja przygotowywana jest raz,
+    przy imporcie modułu trasy, a nie przy każdym zapytaniu.
+
+    Parametry:\n
+    - ``fields`` (tuple[str, ...]): Nazwy atrybutów, w kolejności kluczy odpowiedzi.\n
+    - ``converters`` (dict[str, Callable], opcjonalnie): Funkcje konwertujące wartości wybranych pól.
+
+    Zwraca:\n
+    - ``Callable[[Any], dict[str, Any]]``: Funkcja serializująca.
+    """
+
+    values: attrgetter = attrgetter(*fields)
+    converter_items: tuple[tuple[str, Callable[[Any], Any]], ...] = tuple((converters or {}).items())
+
+    if len(fields) == 1:
+        single: str = fields[0]
+        base = lambda obj: {single: values(obj)}
+    else:
+        base = lambda obj: dict(zip(fields, values(obj)))
+
+    if not converter_items:
+        return base
+
+    def serialize(obj: Any) -> dict[str, Any]:
+        data: dict[str, Any] = base(obj)
+        for field, convert in converter_items:
+            data[field] = convert(data[field])
+        return data
+
+    return serialize
@@ -1,10 +1,15 @@
-from flask import Blueprint, request, jsonify, Response
+from flask import Blueprint, jsonify, Response
 from flask_jwt_extended import jwt_required
 
-from app.services.discountService import DiscountService
+from app.routes.decorators.errorResponse import error_response
+from app.routes.decorators.requestJson import load_json
+from app.services import discounts_service
 
 apply_discounts_blueprint: Blueprint = Blueprint("apply_discounts", __name__, url_prefix="/discounts")
 
+REQUIRED_FIELDS: frozenset[str] = frozenset(("amount", "code"))
+REQUIRED_FIELDS_ERROR: str = "Nieprawidłowe dane żądania. Wymagane pola: amount, code"
+
 
 @apply_discounts_blueprint.route("/apply", methods=["POST"])
 @jwt_required()
@@ -28,27 +33,28 @@ def apply_discount() -> tuple[Response, int]:
     - ``500`` **Internal Server Error**: Jeśli wystąpił błąd serwera.
     """
 
-    discount_service: DiscountService = DiscountService()
     try:
-        data = request.get_json()
+        data = load_json()
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
 
-        required_fields: list[str] = ["amount", "code"]
-        if not data or not all(field in data for field in required_fields):
-            return jsonify({"error": f"Nieprawidłowe dane żądania. Wymagane pola: {', '.join(required_fields)}"}), 400
+    try:
+        if not data or not REQUIRED_FIELDS.issubset(data):
+            return error_response(REQUIRED_FIELDS_ERROR, 400)
 
         amount: float = float(data["amount"])
         code: str = data["code"].strip()
 
         if amount <= 0:
-            return jsonify({"error": "Kwota musi być większa niż 0"}), 400
+            return error_response("Kwota musi być większa niż 0", 400)
 
-        final_amount, message, status = discount_service.apply_discount(amount, code)
+        final_amount, message, status = discounts_service.apply_discount(amount, code)
 
         return jsonify({
             "original_amount": str(amount),
             "final_amount": str(final_amount),
             "message": message
-        }), 200 if status == discount_service.DiscountStatus.SUCCESS else 400
+        }), 200 if status == discounts_service.DiscountStatus.SUCCESS else 400
 
     except Exception as e:
         return jsonify({"error": str(e)}), 500
@@ -1,13 +1,18 @@
-from flask import Blueprint, request, jsonify, Response
+from flask import Blueprint, jsonify, Response
 from flask_jwt_extended import jwt_required
 from datetime import datetime
 
 from app.models.discount import Discount
 from app.routes.decorators.adminRequired import admin_required
-from app.services.discountService import DiscountService
+from app.routes.decorators.errorResponse import error_response
+from app.routes.decorators.requestJson import load_json
+from app.services import discounts_service
 
 create_discounts_blueprint: Blueprint = Blueprint("create_discounts", __name__, url_prefix="/discounts")
 
+REQUIRED_FIELDS: frozenset[str] = frozenset(("code", "value"))
+REQUIRED_FIELDS_ERROR: str = "Nieprawidłowe dane żądania. Wymagane pola: code, value"
+
 
 @create_discounts_blueprint.route("/create", methods=["POST"])
 @jwt_required()
@@ -34,13 +39,14 @@ def create_discount() -> tuple[Response, int]:
     - ``500`` **Internal Server Error**: Jeśli wystąpił błąd serwera.
     """
 
-    discount_service: DiscountService = DiscountService()
     try:
-        data = request.get_json()
+        data = load_json()
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
 
-        required_fields: list[str] = ["code", "value"]
-        if not data or not all(field in data for field in required_fields):
-            return jsonify({"error": f"Nieprawidłowe dane żądania. Wymagane pola: {', '.join(required_fields)}"}), 400
+    try:
+        if not data or not REQUIRED_FIELDS.issubset(data):
+            return error_response(REQUIRED_FIELDS_ERROR, 400)
 
         code: str = data["code"].strip()
         value: float = float(data["value"])
@@ -48,23 +54,23 @@ def create_discount() -> tuple[Response, int]:
         max_uses: int = int(data["max_uses"]) if "max_uses" in data and data["max_uses"] else None
 
         if value <= 0 or value > 100:
-            return jsonify({"error": "Wartość zniżki musi być między 0 a 100"}), 400
+            return error_response("Wartość zniżki musi być między 0 a 100", 400)
 
-        if discount_service.get_by_code(code):
-            return jsonify({"error": "Kod zniżki już istnieje"}), 400
+        if discounts_service.get_by_code(code):
+            return error_response("Kod zniżki już istnieje", 400)
 
-        discount: Discount = discount_service.create_discount(code, value, expiry_on, max_uses)
+        discount: Discount = discounts_service.create_discount(code, value, expiry_on, max_uses)
 
         return jsonify({
             "id": discount.id,
             "code": discount.code,
-            "value": str(discount.value),
+            "value": f"{discount.value:.2f}",
             "expiry_on": discount.expiry_on if discount.expiry_on else None,
             "max_uses": discount.max_uses,
             "usage_count": discount.usage_count
         }), 201
 
     except ValueError as e:
-        return jsonify({"error": "Nieprawidłowy format daty dla expiry_on. Użyj formatu ISO (RRRR-MM-DDTHH:MM:SS)"}), 400
+        return error_response("Nieprawidłowy format daty dla expiry_on. Użyj formatu ISO (RRRR-MM-DDTHH:MM:SS)", 400)
     except Exception as e:
         return jsonify({"error": str(e)}), 500
@@ -2,8 +2,9 @@ from flask import Blueprint, jsonify, Response
 from flask_jwt_extended import jwt_required, get_jwt_identity
 
 from app.routes.decorators.adminRequired import admin_required
+from app.routes.decorators.errorResponse import error_response
 from app.services import UsersService
-from app.services.discountService import DiscountService
+from app.services import discounts_service
 
 delete_discounts_blueprint = Blueprint("delete_discounts", __name__, url_prefix="/discounts")
 
@@ -30,11 +31,10 @@ def delete_discount(discount_id) -> tuple[Response, int]:
     - ``500`` **Internal Server Error**: Jeśli wystąpił błąd serwera.
     """
 
-    discount_service: DiscountService = DiscountService()
     try:
-        if discount_service.delete_discount(discount_id):
+        if discounts_service.delete_discount(discount_id):
             return jsonify({"message": "Zniżka została pomyślnie usunięta"}), 200
-        return jsonify({"error": "Nie znaleziono zniżki"}), 404
+        return error_response("Nie znaleziono zniżki", 404)
 
     except Exception as e:
         return jsonify({"error": str(e)}), 500
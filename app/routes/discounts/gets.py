@@ -1,19 +1,28 @@
-from flask import Blueprint, jsonify, Response
+from flask import Blueprint, Response
 from flask_jwt_extended import jwt_required, get_jwt_identity
 
 from app.models.discount import Discount
 from app.routes.decorators.adminRequired import admin_required
+from app.routes.decorators.errorResponse import error_response
+from app.routes.decorators.jsonResponse import json_response
 from app.routes.decorators.pagination import paginate
-from app.services.discountService import DiscountService
+from app.routes.decorators.serializer import make_serializer
+from app.services import discounts_service
 
 gets_discounts_blueprint: Blueprint = Blueprint("gets_discounts", __name__, url_prefix="/discounts")
 
 
+_discount_to_dict = make_serializer(
+    ("id", "code", "value", "expiry_on", "max_uses", "usage_count"),
+    {"value": lambda value: f"{value:.2f}", "expiry_on": lambda expiry_on: expiry_on or None}
+)
+
+
 @gets_discounts_blueprint.route("/get-all", methods=["GET"])
 @jwt_required()
 @admin_required
-@paginate
-def get_all_discounts() -> list[dict[str, str | int]]:
+@paginate(serializer=_discount_to_dict)
+def get_all_discounts() -> list[Discount]:
     """
     Pobiera wszystkie zniżki.
 
@@ -28,20 +37,9 @@ def get_all_discounts() -> list[dict[str, str | int]]:
     - ``500`` **Internal Server Error**: Jeśli wystąpił błąd serwera.
     """
 
-    discount_service: DiscountService = DiscountService()
-    discounts: list[Discount] = discount_service.get_all()
+    discounts: list[Discount] = discounts_service.get_all()
 
-    return [
-        {
-            "id": discount.id,
-            "code": discount.code,
-            "value": str(discount.value),
-            "expiry_on": discount.expiry_on if discount.expiry_on else None,
-            "max_uses": discount.max_uses,
-            "usage_count": discount.usage_count
-        }
-        for discount in discounts
-    ]
+    return discounts
 
 
 @gets_discounts_blueprint.route("/<int:discount_id>", methods=["GET"])
@@ -66,17 +64,9 @@ def get_discount(discount_id) -> tuple[Response, int]:
     - ``500`` **Internal Server Error**: Jeśli wystąpił błąd serwera.
     """
 
-    discount_service: DiscountService = DiscountService()
-    discount: Discount = discount_service.get(discount_id)
+    discount: Discount = discounts_service.get(discount_id)
 
     if not discount:
-        return jsonify({"error": "Nie znaleziono zniżki"}), 404
-
-    return jsonify({
-        "id": discount.id,
-        "code": discount.code,
-        "value": str(discount.value),
-        "expiry_on": discount.expiry_on if discount.expiry_on else None,
-        "max_uses": discount.max_uses,
-        "usage_count": discount.usage_count
-    }), 200
+        return error_response("Nie znaleziono zniżki", 404)
+
+    return json_response(_discount_to_dict(discount))
@@ -1,10 +1,12 @@
-from flask import Blueprint, request, jsonify, Response
+from flask import Blueprint, jsonify, Response
 from flask_jwt_extended import jwt_required
 from datetime import datetime
 
 from app.models.discount import Discount
 from app.routes.decorators.adminRequired import admin_required
-from app.services.discountService import DiscountService
+from app.routes.decorators.errorResponse import error_response
+from app.routes.decorators.requestJson import load_json
+from app.services import discounts_service
 
 update_discounts_blueprint: Blueprint = Blueprint("update_discounts", __name__, url_prefix="/discounts")
 
@@ -38,25 +40,28 @@ def update_discount(discount_id) -> tuple[Response, int]:
     - ``500`` **Internal Server Error**: Jeśli wystąpił błąd serwera.
     """
 
-    discount_service: DiscountService = DiscountService()
     try:
-        data = request.get_json()
+        data = load_json()
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    try:
         if not data:
-            return jsonify({"error": "Nie przesłano żadnych danych do aktualizacji"}), 400
+            return error_response("Nie przesłano żadnych danych do aktualizacji", 400)
 
         updates: dict[str, str | float] = {}
 
         if "code" in data:
             code: str = data["code"].strip()
-            existing_discount: Discount = discount_service.get_by_code(code)
+            existing_discount: Discount = discounts_service.get_by_code(code)
             if existing_discount and existing_discount.id != discount_id:
-                return jsonify({"error": "Kod zniżki już istnieje"}), 400
+                return error_response("Kod zniżki już istnieje", 400)
             updates["code"] = code
 
         if "value" in data:
             value: float = float(data["value"])
             if value <= 0 or value > 100:
-                return jsonify({"error": "Wartość zniżki musi być między 0 a 100"}), 400
+                return error_response("Wartość zniżki musi być między 0 a 100", 400)
             updates["value"] = value
 
         if "expiry_on" in data:
@@ -66,15 +71,15 @@ def update_discount(discount_id) -> tuple[Response, int]:
             max_uses: int = int(data["max_uses"]) if data["max_uses"] else None
             updates["max_uses"] = max_uses
 
-        updated_discount: Discount = discount_service.update_discount(discount_id, **updates)
+        updated_discount: Discount = discounts_service.update_discount(discount_id, **updates)
 
         if not updated_discount:
-            return jsonify({"error": "Nie znaleziono zniżki"}), 404
+            return error_response("Nie znaleziono zniżki", 404)
 
         return jsonify({
             "id": updated_discount.id,
             "code": updated_discount.code,
-            "value": str(updated_discount.value),
+            "value": f"{updated_discount.value:.2f}",
             "expiry_on": updated_discount.expiry_on if updated_discount.expiry_on else None,
             "max_uses": updated_discount.max_uses,
             "usage_count": updated_discount.usage_count
@@ -1,9 +1,11 @@
-from flask import Blueprint, request, jsonify, Response
+from flask import Blueprint, jsonify, Response
 from flask_jwt_extended import jwt_required, get_jwt_identity
 
 from app.models.faq import Faq
 from app.routes.decorators.adminRequired import admin_required
-from app.services import FaqService
+from app.routes.decorators.errorResponse import error_response
+from app.routes.decorators.requestJson import load_json
+from app.services import faq_service
 
 create_faq_blueprint: Blueprint = Blueprint("create_faq", __name__, url_prefix="/faq")
 
@@ -31,24 +33,26 @@ def create() -> tuple[Response, int]:
     - ``500`` **Internal Server Error**: Jeśli wystąpił błąd serwera.
     """
 
-    faq_service: FaqService = FaqService()
-    question: str = request.json["question"]
-    answer: str = request.json["answer"]
+    try:
+        data = load_json()
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
 
-    if "question" not in request.json or "answer" not in request.json:
-        return jsonify({"error": "Brak odpowiedzi lub pytania"}), 400
+    if "question" not in data or "answer" not in data:
+        return error_response("Brak odpowiedzi lub pytania", 400)
 
-    if not isinstance(question, str) or not isinstance(answer, str):
-        return jsonify({"error": "Pytanie i odpowiedź muszą być typu string"}), 400
+    question: str = data["question"]
+    answer: str = data["answer"]
 
+    if not isinstance(question, str) or not isinstance(answer, str):
+        return error_response("Pytanie i odpowiedź muszą być typu string", 400)
 
-    if faq_service.get_by_question(question):
-        return jsonify({"error": "Pytanie już istnieje"}), 400
+    if faq_service.question_exists(question):
+        return error_response("Pytanie już istnieje", 400)
 
     faq: Faq = faq_service.create(user_id=(get_jwt_identity()), question=question, answer=answer, public=False)
-    return_faq: Faq = faq_service.get(faq.id)
 
-    return jsonify({"faq": faq_service.to_dict(return_faq)}), 200
+    return jsonify({"faq": faq_service.to_minimal_dict(faq)}), 200
 
 
 @create_faq_blueprint.route("/add-question", methods=["POST"])
@@ -71,19 +75,22 @@ def add_question() -> tuple[Response, int]:
     - ``500`` **Internal Server Error**: Jeśli wystąpił błąd serwera.
     """
 
-    faq_service: FaqService = FaqService()
-    question: str = request.json["question"]
+    try:
+        data = load_json()
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
 
-    if "question" not in request.json:
-        return jsonify({"error": "Brak odpowiedzi lub pytania"}), 400
+    if "question" not in data:
+        return error_response("Brak odpowiedzi lub pytania", 400)
+
+    question: str = data["question"]
 
     if not isinstance(question, str):
-        return jsonify({"error": "Pytanie musi być typu string"}), 400
+        return error_response("Pytanie musi być typu string", 400)
 
     faq: Faq = faq_service.add_question(user_id=(get_jwt_identity()), question=question)
-    return_faq: Faq = faq_service.get(faq.id)
 
-    return jsonify({"faq": faq_service.to_dict(return_faq)}), 200
+    return jsonify({"faq": faq_service.to_minimal_dict(faq)}), 200
 
 
 @create_faq_blueprint.route("/add-answer/<int:faq_id>", methods=["POST"])
@@ -111,22 +118,22 @@ def add_answer(faq_id) -> tuple[Response, int]:
     - ``500`` **Internal Server Error**: Jeśli wystąpił błąd serwera.
     """
 
-    faq_service: FaqService = FaqService()
-    answer: str = request.json["answer"]
-
-    faq: Faq = faq_service.get(faq_id)
+    try:
+        data = load_json()
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
 
-    if not faq:
-        return jsonify({"error": "Pytanie nie istnieje"}), 400
+    if "answer" not in data:
+        return error_response("Brak odpowiedzi", 400)
 
-    if "answer" not in request.json:
-        return jsonify({"error": "Brak odpowiedzi"}), 400
+    answer: str = data["answer"]
 
+    if not faq_service.get(faq_id):
+        return error_response("Pytanie nie istnieje", 400)
 
     if not isinstance(answer, str):
-        return jsonify({"error": "Pytanie musi być typu string"}), 400
+        return error_response("Pytanie musi być typu string", 400)
 
     faq: Faq = faq_service.add_answer(faq_id, answer)
-    return_faq: Faq = faq_service.get(faq.id)
 
-    return jsonify({"faq": faq_service.to_dict(return_faq)}), 200
+    return jsonify({"faq": faq_service.to_minimal_dict(faq)}), 200
@@ -2,7 +2,8 @@ from flask import Blueprint, request, jsonify, Response
 from flask_jwt_extended import jwt_required
 
 from app.routes.decorators.adminRequired import admin_required
-from app.services import FaqService
+from app.routes.decorators.errorResponse import error_response
+from app.services import faq_service
 
 delete_faq_blueprint: Blueprint = Blueprint("delete_faq", __name__, url_prefix="/faq")
 
@@ -29,9 +30,7 @@ def delete_faq(faq_id) -> tuple[Response, int]:
     - ``500`` **Internal Server Error**: Jeśli wystąpił błąd serwera.
     """
 
-    faq_service: FaqService = FaqService()
-
     if faq_service.delete(int(faq_id)):
         return jsonify({"success": "Usunięto faq"}), 200
     else:
-        return jsonify({"error": "Nie znaleziono faq"}), 404
+        return error_response("Nie znaleziono faq", 404)
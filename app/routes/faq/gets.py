@@ -1,11 +1,10 @@
-from typing import Any
-
 from flask import Blueprint, jsonify, Response
 from flask_jwt_extended import jwt_required, get_jwt_identity
 
 from app.models.faq import Faq
+from app.routes.decorators.errorResponse import error_response
 from app.routes.decorators.pagination import paginate
-from app.services import FaqService, UsersService
+from app.services import faq_service
 
 gets_faq_blueprint: Blueprint = Blueprint("gets_faq", __name__, url_prefix="/faq")
 
@@ -26,30 +25,22 @@ def get_faq(faq_id: int) -> tuple[Response, int]:
 
     Zwraca:\n
     - ``200`` **OK**: Szczegóły FAQ w formacie JSON.\n
-    - ``403`` **Forbidden**: Jeśli FAQ nie jest publiczny, a użytkownik nie jest administratorem.\n
     - ``404`` **Not Found**: Jeśli nie znaleziono FAQ o podanym ID.\n
     - ``500`` **Internal Server Error**: Jeśli wystąpił błąd serwera.
     """
 
-    faq_service: FaqService = FaqService()
     faq: Faq = faq_service.get(faq_id)
 
-    user_service: UsersService = UsersService()
-    user_id: int = int(get_jwt_identity())
-    role: str = user_service.get(user_id).role
-
     if not faq:
-        return jsonify({"error": "Nie znaleziono faq"}), 404
-    # if role != "admin" and not faq.public:
-    #     return jsonify({"error": "Faq nie jest publiczny"}), 403
+        return error_response("Nie znaleziono faq", 404)
 
     return jsonify({"faq": faq_service.to_dict(faq)}), 200
 
 
 @gets_faq_blueprint.route("/get-all", methods=["GET"])
 @jwt_required()
-@paginate
-def get_all_faq() -> list[dict[str, Any]]:
+@paginate(serializer=faq_service.to_dict)
+def get_all_faq() -> list[Faq]:
     """
     Pobiera wszystkie FAQ.
 
@@ -64,25 +55,17 @@ def get_all_faq() -> list[dict[str, Any]]:
     - ``500`` **Internal Server Error**: Jeśli wystąpił błąd serwera.
     """
 
-    faq_service: FaqService = FaqService()
+    # Filtrowanie niepublicznych FAQ dla zwykłych użytkowników nie jest włączone - funkcja publikacji
+    # nie jest wdrożona w frontendzie.
     faqs: list[Faq] = faq_service.get_all()
 
-    user_service: UsersService = UsersService()
-    user_id: int = int(get_jwt_identity())
-    role: str = user_service.get(user_id).role
-
-    # if role != "admin":
-    #     faqs = [faq for faq in faqs if faq.public]
-    #     return [faq_service.to_dict(faq) for faq in faqs], 200
-    # else:
-    # ^ Funkcja publikacji nie jest wdrożona w frontendzie - nie starczyło czasu.
-    return [faq_service.to_dict(faq) for faq in faqs]
+    return faqs
 
 
 @gets_faq_blueprint.route("/get-all/self", methods=["GET"])
 @jwt_required()
-@paginate
-def get_all_faq_self() -> list[dict[str, Any]]:
+@paginate(serializer=faq_service.to_dict)
+def get_all_faq_self() -> list[Faq]:
     """
     Pobiera wszystkie FAQ użytkownika.
 
@@ -97,8 +80,7 @@ def get_all_faq_self() -> list[dict[str, Any]]:
     - ``500`` **Internal Server Error**: Jeśli wystąpił błąd serwera.
     """
 
-    faq_service: FaqService = FaqService()
     user_id: int = int(get_jwt_identity())
     faqs: list[Faq] = faq_service.get_by_user(user_id)
 
-    return [faq_service.to_dict(faq) for faq in faqs]
+    return faqs
@@ -1,9 +1,11 @@
-from flask import Blueprint, request, jsonify, Response
+from flask import Blueprint, jsonify, Response
 from flask_jwt_extended import jwt_required
 
 from app.models.faq import Faq
 from app.routes.decorators.adminRequired import admin_required
-from app.services import FaqService
+from app.routes.decorators.errorResponse import error_response
+from app.routes.decorators.requestJson import load_json
+from app.services import faq_service
 
 update_faq_blueprint: Blueprint = Blueprint("update_faq", __name__, url_prefix="/faq")
 
@@ -35,15 +37,18 @@ def update(faq_id) -> tuple[Response, int]:
     - ``500`` **Internal Server Error**: Jeśli wystąpił błąd serwera.
     """
 
-    data = request.get_json()
-    faq_service: FaqService = FaqService()
+    try:
+        data = load_json()
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    if not any(key in data for key in ['question', 'answer', 'public']):
+        return error_response("Nie przesłano żadnych danych do aktualizacji", 400)
+
     faq: Faq = faq_service.get(int(faq_id))
 
     if not faq:
-        return jsonify({"error": "Pytanie nie istnieje"}), 400
-
-    if not any(key in data for key in ['question', 'answer', 'public']):
-        return jsonify({"error": "Nie przesłano żadnych danych do aktualizacji"}), 400
+        return error_response("Pytanie nie istnieje", 400)
 
     question: str = data.get('question', faq.question)
     answer: str = data.get('answer', faq.answer)
@@ -51,21 +56,20 @@ def update(faq_id) -> tuple[Response, int]:
 
     if 'question' in data:
         if not isinstance(question, str):
-            return jsonify({"error": "Pytanie musi być typu string"}), 400
+            return error_response("Pytanie musi być typu string", 400)
 
     if 'answer' in data:
         if not isinstance(answer, str):
-            return jsonify({"error": "Odpowiedź musi być typu string"}), 400
+            return error_response("Odpowiedź musi być typu string", 400)
 
     if 'public' in data:
         if not isinstance(public, bool):
-            return jsonify({"error": "Pole public musi być typu bool"}), 400
+            return error_response("Pole public musi być typu bool", 400)
         if public == faq.public:
-            return jsonify({"error": "Pole public nie zostało zmienione"}), 400
+            return error_response("Pole public nie zostało zmienione", 400)
 
-    faq_service.update(int(faq_id), question, answer, public)
-    return_faq: Faq = faq_service.get(faq.id)
-    return jsonify({"faq": faq_service.to_dict(return_faq)}), 200
+    faq = faq_service.update(int(faq_id), question, answer, public)
+    return jsonify({"faq": faq_service.to_minimal_dict(faq)}), 200
 
 
 @update_faq_blueprint.route("/publish/<int:faq_id>", methods=["PUT"])
@@ -90,15 +94,13 @@ def publish(faq_id) -> tuple[Response, int]:
     - ``500`` **Internal Server Error**: Jeśli wystąpił błąd serwera.
     """
 
-    faq_service: FaqService = FaqService()
     faq: Faq = faq_service.get(int(faq_id))
 
     if not faq:
-        return jsonify({"error": "Pytanie nie istnieje"}), 400
+        return error_response("Pytanie nie istnieje", 400)
 
     if faq.public:
-        return jsonify({"error": "Pytanie jest już opublikowane"}), 400
+        return error_response("Pytanie jest już opublikowane", 400)
 
-    faq_service.publish(int(faq_id))
-    return_faq: Faq = faq_service.get(faq.id)
-    return jsonify({"faq": faq_service.to_dict(return_faq)}), 200
+    faq = faq_service.publish(int(faq_id))
+    return jsonify({"faq": faq_service.to_minimal_dict(faq)}), 200
@@ -1,9 +1,11 @@
 from flask import Blueprint, Response, jsonify
-from flask_jwt_extended import jwt_required, get_jwt_identity
+from flask_jwt_extended import jwt_required
 
 from app.models.transaction import Transaction
 from app.models.user import User
-from app.services import ReportsService, TransactionService, UsersService
+from app.routes.decorators.currentIdentity import current_identity
+from app.routes.decorators.errorResponse import error_response
+from app.services import reports_service, transaction_service, users_service
 
 create_invoices_blueprint: Blueprint = Blueprint('create_invoices', __name__, url_prefix='/invoices/create')
 
@@ -30,29 +32,20 @@ def create_invoice(transaction_id) -> tuple[Response, int]:
     - ``500`` **Internal Server Error**: Jeśli wystąpił błąd serwera.
     """
 
-    transactions_service: TransactionService = TransactionService()
-    reports_service: ReportsService = ReportsService()
-    users_service: UsersService = UsersService()
+    user_id, is_admin = current_identity()
 
-    try:
-        user_id: int = int(get_jwt_identity())
-        user: User = users_service.get(user_id)
+    transaction: Transaction = transaction_service.get(transaction_id)
+    if not transaction:
+        return error_response("Transakcja nie została znaleziona", 404)
 
-        transaction: Transaction = transactions_service.get(transaction_id)
-        if not transaction:
-            return jsonify({"error": "Transakcja nie została znaleziona"}), 404
+    if transaction.user_id != user_id and not is_admin:
+        return error_response("Brak dostępu", 403)
 
-        if transaction.user_id != user_id:
-            if user.role != "admin":
-                return jsonify({"error": "Brak dostępu"}), 403
+    user: User = users_service.get(transaction.user_id)
 
-            user = users_service.get(transaction.user_id)
+    invoice_id: int = reports_service.generate_invoice([transaction], user, user_id)
 
-        invoice_id: int = reports_service.generate_invoice([transaction], user, user_id)
+    if not invoice_id:
+        return error_response("Nie udało sie wygenerować faktury", 400)
 
-        if not invoice_id:
-            return jsonify({"error": "Nie udało sie wygenerować faktury"}), 400
-
-        return jsonify({"invoice_id": invoice_id}), 200
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
\ No newline at end of file
+    return jsonify({"invoice_id": invoice_id}), 200
\ No newline at end of file
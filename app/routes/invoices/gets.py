@@ -1,20 +1,25 @@
-import os
-
-from flask import Blueprint, Response, jsonify, send_file
+from flask import Blueprint, Response, send_file, current_app
 from flask_jwt_extended import jwt_required, get_jwt_identity
 
 from app.models.report import Report
-from app.models.user import User
 from app.routes.decorators.adminRequired import admin_required
+from app.routes.decorators.currentIdentity import current_identity
+from app.routes.decorators.errorResponse import error_response
 from app.routes.decorators.pagination import paginate
-from app.services import ReportsService, AttachmentsService, UsersService
+from app.routes.decorators.serializer import make_serializer
+from app.services import attachments_service, reports_service
 
 gets_invoices_blueprint: Blueprint = Blueprint('gets_invoices', __name__, url_prefix='/invoices/')
 
+_own_invoice_to_dict = make_serializer(("id", "generated_on", "pdf_id"))
+_invoice_to_dict = make_serializer(("id", "generated_by", "generated_on", "pdf_id"))
+
+INVOICE_MAX_AGE: int = 3600
+
 
 @gets_invoices_blueprint.route('/<int:invoice_id>', methods=['GET'])
 @jwt_required()
-def get_invoice(invoice_id) -> tuple[Response, int]:
+def get_invoice(invoice_id) -> Response | tuple[Response, int]:
     """
     Pobiera fakturę.
 
@@ -28,38 +33,39 @@ def get_invoice(invoice_id) -> tuple[Response, int]:
 
     Zwraca:\n
     - ``200`` **OK**: Plik PDF faktury.\n
+    - ``304`` **Not Modified**: Jeśli klient posiada aktualną kopię pliku.\n
     - ``404`` **Not Found**: Jeśli faktura lub plik faktury nie został znaleziony.\n
     - ``500`` **Internal Server Error**: Jeśli wystąpił błąd serwera.
     """
 
-    reports_service: ReportsService = ReportsService()
-    attachments_service: AttachmentsService = AttachmentsService()
-    users_service: UsersService = UsersService()
+    user_id, is_admin = current_identity()
+    invoice: Report = reports_service.get(invoice_id)
 
-    try:
-        user_id: int = int(get_jwt_identity())
-        user: User = users_service.get(user_id)
-        invoice: Report = reports_service.get(invoice_id)
+    if not invoice:
+        return error_response("Faktura nie została znaleziona", 404)
 
-        if not invoice:
-            return jsonify({"error": "Faktura nie została znaleziona"}), 404
+    if invoice.generated_by != user_id and not is_admin:
+        return error_response("Brak dostępu", 403)
 
-        if invoice.generated_by != user_id and user.role != "admin":
-            return jsonify({"error": "Brak dostępu"}), 403
+    relative_path: str = f"all/invoices/invoice_{invoice.pdf_id}.pdf"
 
-        invoice_pdf = attachments_service.get_file_path(
-            rf"attachments/all/invoices/invoice_{invoice.pdf_id}.pdf")
-        if not os.path.exists(invoice_pdf):
-            return jsonify({"error": "Nie znaleziono pliku faktury"}), 404
+    # Plik faktury nie zmienia się po wygenerowaniu - przy USE_XACCEL wysyła go nginx, w przeciwnym razie
+    # send_file obsługuje ETag/Last-Modified, więc ponowne pobrania kończą się odpowiedzią 304.
+    if current_app.config.get("USE_XACCEL"):
+        response: Response = Response(mimetype="application/pdf")
+        response.headers["X-Accel-Redirect"] = f"{current_app.config['XACCEL_PREFIX']}{relative_path}"
+        return response
 
-        return send_file(invoice_pdf), 200
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+    try:
+        return send_file(attachments_service.get_file_path(f"attachments/{relative_path}"),
+                         conditional=True, max_age=INVOICE_MAX_AGE)
+    except FileNotFoundError:
+        return error_response("Nie znaleziono pliku faktury", 404)
 
 @gets_invoices_blueprint.route('/self', methods=['GET'])
 @jwt_required()
-@paginate
-def get_own_invoices() -> tuple[Response, int] | list[dict[str, str | int]]:
+@paginate(serializer=_own_invoice_to_dict)
+def get_own_invoices() -> list[Report]:
     """
     Pobiera własne faktury.
 
@@ -73,25 +79,16 @@ def get_own_invoices() -> tuple[Response, int] | list[dict[str, str | int]]:
     - ``500`` **Internal Server Error**: Jeśli wystąpił błąd serwera.
     """
 
-    reports_service: ReportsService = ReportsService()
-
-    try:
-        user_id: int = int(get_jwt_identity())
-        invoices: list[Report] = reports_service.get_by_user(user_id)
+    user_id: int = int(get_jwt_identity())
+    invoices: list[Report] = reports_service.get_invoices(user_id)
 
-        return [{
-            "id": invoice.id,
-            "generated_on": invoice.generated_on,
-            "pdf_id": invoice.pdf_id
-        } for invoice in invoices if invoice.type.lower() == "invoice"]
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+    return invoices
 
 @gets_invoices_blueprint.route("/all", methods=["GET"])
 @jwt_required()
 @admin_required
-@paginate
-def get_all_invoices() -> tuple[Response, int] | list[dict[str, str | int]]:
+@paginate(serializer=_invoice_to_dict)
+def get_all_invoices() -> list[Report]:
     """
     Pobiera wszystkie faktury.
 
@@ -105,16 +102,6 @@ def get_all_invoices() -> tuple[Response, int] | list[dict[str, str | int]]:
     - ``500`` **Internal Server Error**: Jeśli wystąpił błąd serwera.
     """
 
-    reports_service: ReportsService = ReportsService()
+    invoices: list[Report] = reports_service.get_invoices()
 
-    try:
-        invoices: list[Report] = reports_service.get_all()
-
-        return [{
-            "id": invoice.id,
-            "generated_by": invoice.generated_by,
-            "generated_on": invoice.generated_on,
-            "pdf_id": invoice.pdf_id
-        } for invoice in invoices if invoice.type.lower() == "invoice"]
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
\ No newline at end of file
+    return invoices
\ No newline at end of file
@@ -4,11 +4,14 @@ from flask import Blueprint, request, jsonify, Response
 from flask_jwt_extended import jwt_required, get_jwt_identity
 
 from app.models.car import Car
-from app.services import CarsService
+from app.routes.decorators.errorResponse import error_response
+from app.services import cars_service
 from app.services.notificationService import NotificationService
 
 create_notifications_ai_blueprint: Blueprint = Blueprint('notifications_ai', __name__, url_prefix="/notifications/ai")
 
+notification_service: NotificationService = NotificationService()
+
 
 @create_notifications_ai_blueprint.route("/generate", methods=["POST"])
 @jwt_required()
@@ -33,21 +36,19 @@ def create() -> tuple[Response, int]:
     user_id: int = int(get_jwt_identity())
 
     car_id = request.args.get("car_id")
-    cars_service: CarsService = CarsService()
 
     if not car_id:
         user_cars: list[Car] = cars_service.get_by_owner(user_id)
-        car: Car = user_cars[random.randint(0, len(user_cars) - 1)]
+        car: Car | None = random.choice(user_cars) if user_cars else None
     else:
         car: Car = cars_service.get(int(car_id))
 
     if not car:
-        return jsonify({"error": "Nie znaleziono samochodu"}), 404
+        return error_response("Nie znaleziono samochodu", 404)
 
-    notification_service: NotificationService = NotificationService()
     notification: str | bool = notification_service.generate_notification(int(car.id))
 
     if not notification:
-        return jsonify({"error": "Błąd podczas tworzenia powiadomienia AI"}), 500
+        return error_response("Błąd podczas tworzenia powiadomienia AI", 500)
 
     return jsonify({"notification": notification}), 200
\ No newline at end of file
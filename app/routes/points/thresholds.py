@@ -4,15 +4,21 @@ from flask_jwt_extended import jwt_required, get_jwt_identity
 from app.models.pointThreshold import PointThreshold
 from app.routes.decorators.adminRequired import admin_required
 from app.routes.decorators.pagination import paginate
-from app.services import UsersService
-from app.services.pointThresholdService import PointThresholdService
-from app.services.discountService import DiscountService
-import random
+from app.routes.decorators.serializer import make_serializer
+from app.services import discounts_service, points_service, users_service
+import secrets
 import string
 from datetime import datetime, timedelta
 
 points_blueprint: Blueprint = Blueprint('points', __name__, url_prefix="/points")
 
+DISCOUNT_CODE_ALPHABET: str = string.ascii_uppercase + string.digits
+
+_threshold_to_dict = make_serializer(
+    ("id", "points_required", "discount_value", "description", "created_on"),
+    {"discount_value": float}
+)
+
 """
 Punktyfikacja nie została wdrożona do frontendu - nie starczyło czasu.
 """
@@ -20,8 +26,8 @@ Punktyfikacja nie została wdrożona do frontendu - nie starczyło czasu.
 
 @points_blueprint.route("/thresholds/get-all", methods=["GET"])
 @jwt_required()
-@paginate
-def get_thresholds() -> list[dict[str, int | str | float]] | tuple[Response, int]:
+@paginate(serializer=_threshold_to_dict)
+def get_thresholds() -> list[PointThreshold] | tuple[Response, int]:
     """
     Pobiera wszystkie progi punktowe.
 
@@ -37,19 +43,9 @@ def get_thresholds() -> list[dict[str, int | str | float]] | tuple[Response, int
     """
 
     try:
-        service: PointThresholdService = PointThresholdService()
-        thresholds: list[PointThreshold] = service.get_available_thresholds()
-
-        return [
-            {
-                "id": t.id,
-                "points_required": t.points_required,
-                "discount_value": float(t.discount_value),
-                "description": t.description,
-                "created_on": t.created_on
-            }
-            for t in thresholds
-        ]
+        thresholds: list[PointThreshold] = points_service.get_available_thresholds()
+
+        return thresholds
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -85,8 +81,7 @@ def create_threshold() -> tuple[Response, int]:
         if not all(field in data for field in required_fields):
             return jsonify({"error": "Brak wymaganych pól"}), 400
 
-        service: PointThresholdService = PointThresholdService()
-        threshold: PointThreshold = service.create_threshold(
+        threshold: PointThreshold = points_service.create_threshold(
             points_required=int(data["points_required"]),
             discount_value=float(data["discount_value"]),
             description=data.get("description")
@@ -126,7 +121,6 @@ def get_points_balance() -> tuple[Response, int]:
     try:
         user_id: int = int(get_jwt_identity())
 
-        users_service: UsersService = UsersService()
         points: int = users_service.get_user_points(user_id)
 
         return jsonify({
@@ -165,11 +159,8 @@ def exchange_points() -> tuple[Response, int]:
             return jsonify({"error": "Brak ID progu punktowego"}), 400
 
         user_id: int = int(get_jwt_identity())
-        users_service: UsersService = UsersService()
-        threshold_service: PointThresholdService = PointThresholdService()
-        discount_service: DiscountService = DiscountService()
 
-        threshold: PointThreshold = threshold_service.get(threshold_id)
+        threshold: PointThreshold = points_service.get(threshold_id)
         if not threshold:
             return jsonify({"error": "Próg punktowy nie istnieje"}), 404
 
@@ -184,27 +175,33 @@ def exchange_points() -> tuple[Response, int]:
         discount_code: str = generate_discount_code()
         expiry_date: int = int((datetime.utcnow() + timedelta(days=30)).timestamp() * 1000)
 
+        # Punkty odejmowane są przed utworzeniem kodu - warunkowy UPDATE rozstrzyga równoległe wymiany,
+        # a przy błędzie tworzenia kodu punkty są zwracane, więc nie powstaje kod bez pokrycia w punktach.
+        if not users_service.deduct_points(user_id, threshold.points_required):
+            return jsonify({"error": "Niewystarczająca liczba punktów"}), 400
+
         try:
-            discount = discount_service.create_discount(
+            discount = discounts_service.create_discount(
                 code=discount_code,
                 value=float(threshold.discount_value),
                 expiry_on=expiry_date,
                 max_uses=1
             )
-
-            if not users_service.deduct_points(user_id, threshold.points_required):
-                discount_service.delete_discount(discount.id)
-                return jsonify({"error": "Nie udało się wymienić punktów"}), 500
-
-            return jsonify({
-                "message": "Pomyślnie wymieniono punkty na kod rabatowy",
-                "discount_code": discount.code,
-                "discount_value": float(discount.value),
-                "expiry_on": discount.expiry_on,
-                "remaining_points": user_points - threshold.points_required
-            }), 200
         except Exception as e:
+            if not users_service.add_points(user_id, threshold.points_required):
+                print(f"[Error] Nie udało się zwrócić {threshold.points_required} punktów użytkownikowi {user_id}")
+                return jsonify({
+                    "error": f"Błąd podczas tworzenia kodu rabatowego: {str(e)}. Nie udało się zwrócić punktów"
+                }), 500
             return jsonify({"error": f"Błąd podczas tworzenia kodu rabatowego: {str(e)}"}), 500
+
+        return jsonify({
+            "message": "Pomyślnie wymieniono punkty na kod rabatowy",
+            "discount_code": discount.code,
+            "discount_value": float(discount.value),
+            "expiry_on": discount.expiry_on,
+            "remaining_points": users_service.get_user_points(user_id)
+        }), 200
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -232,9 +229,7 @@ def delete_threshold(threshold_id) -> tuple[Response, int]:
     """
 
     try:
-        service: PointThresholdService = PointThresholdService()
-
-        if not service.delete_threshold(threshold_id):
+        if not points_service.delete_threshold(threshold_id):
             return jsonify({"error": "Próg punktowy nie istnieje"}), 404
 
         return jsonify({"message": "Próg punktowy został usunięty"}), 200
@@ -265,9 +260,7 @@ def deactivate_threshold(threshold_id) -> tuple[Response, int]:
     """
 
     try:
-        service: PointThresholdService = PointThresholdService()
-
-        if not service.deactivate_threshold(threshold_id):
+        if not points_service.deactivate_threshold(threshold_id):
             return jsonify({"error": "Próg punktowy nie istnieje"}), 404
 
         return jsonify({"message": "Próg punktowy został dezaktywowany"}), 200
@@ -276,12 +269,14 @@ def deactivate_threshold(threshold_id) -> tuple[Response, int]:
 
 
 def generate_discount_code(length: int = 8) -> str:
-    """Generuje unikalny kod rabatowy"""
-
-    code: str = ''.join(random.choices(string.ascii_uppercase + string.digits, k=length))
+    """
+    Generuje unikalny kod rabatowy.
 
-    discount_service: DiscountService = DiscountService()
-    while discount_service.get_by_code(code):
-        code = ''.join(random.choices(string.ascii_uppercase + string.digits, k=length))
+    Kod losowany jest generatorem kryptograficznym (``secrets``), ponieważ stanowi jednorazowe uprawnienie do zniżki.
+    Unikalność sprawdzana jest w indeksie kodów współdzielonego serwisu zniżek, bez zapytania do bazy danych.
+    """
 
-    return code
+    while True:
+        code: str = ''.join(secrets.choice(DISCOUNT_CODE_ALPHABET) for _ in range(length))
+        if not discounts_service.get_by_code(code):
+            return code
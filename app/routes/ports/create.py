@@ -4,8 +4,9 @@ from flask_jwt_extended import jwt_required
 from app.models.port import Port
 from app.models.station import Station
 from app.routes.decorators.adminRequired import admin_required
-from app.services import StationService
-from app.services.portService import PortService
+from app.routes.decorators.errorResponse import error_response
+from app.routes.ports.schema import CONNECTOR_TYPES, CONNECTOR_TYPES_ERROR, PORT_STATUSES, PORT_STATUSES_ERROR
+from app.services import ports_service, station_service
 
 create_ports_blueprint: Blueprint = Blueprint("create_ports", __name__)
 
@@ -37,9 +38,6 @@ def create_port(station_id) -> tuple[Response, int]:
     - ``500`` **Internal Server Error**: Jeśli wystąpił błąd serwera.
     """
 
-    ports_service: PortService = PortService()
-    stations_service: StationService = StationService()
-
     try:
         data = request.get_json()
         if not data:
@@ -51,7 +49,7 @@ def create_port(station_id) -> tuple[Response, int]:
                 "error": f"Nieprawidłowe dane. Wymagane pola nie mogą być puste: {', '.join(required_fields)}"
             }), 400
 
-        station: Station = stations_service.get(station_id)
+        station: Station = station_service.get(station_id)
         if not station:
             return jsonify({"error": "Nie znaleziono stacji o podanym ID"}), 404
 
@@ -66,27 +64,21 @@ def create_port(station_id) -> tuple[Response, int]:
                 "error": "Nieprawidłowy format mocy"
             }), 400
 
-        valid_types: list[str] = ["Type1", "Type2", "CCS", "CHAdeMO", "Tesla NACS"]
         connector_type: str = data["connector_type"]
-        if connector_type not in valid_types:
-            return jsonify({
-                "error": f"Nieprawidłowy typ złącza. Dozwolone wartości: {', '.join(valid_types)}"
-            }), 400
+        if connector_type not in CONNECTOR_TYPES:
+            return error_response(CONNECTOR_TYPES_ERROR, 400)
 
         status: str = "available"
         if "status" in data and data["status"] is not None:
-            valid_statuses: list[str] = ["available", "inuse", "faulty", "maintenance"]
             status = data["status"].lower()
-            if status not in valid_statuses:
-                return jsonify({
-                    "error": f"Nieprawidłowy status. Dozwolone wartości: {', '.join(valid_statuses)}"
-                }), 400
+            if status not in PORT_STATUSES:
+                return error_response(PORT_STATUSES_ERROR, 400)
 
         port: Port = ports_service.create(
             station_id=station_id,
             max_power=max_power,
             connector_type=connector_type,
-            status=("InUse" if status.lower() == "inuse" else status.capitalize())
+            status=PORT_STATUSES[status]
         )
 
         return jsonify({
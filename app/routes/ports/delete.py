@@ -1,7 +1,7 @@
 from flask import Blueprint, jsonify, Response
 from flask_jwt_extended import jwt_required
 from app.routes.decorators.adminRequired import admin_required
-from app.services.portService import PortService
+from app.services import ports_service
 
 delete_ports_blueprint: Blueprint = Blueprint("delete_ports", __name__)
 
@@ -28,8 +28,6 @@ def delete_port(port_id) -> tuple[Response, int]:
     - ``500`` **Internal Server Error**: Jeśli wystąpił nieoczekiwany błąd podczas usuwania portu.
     """
 
-    ports_service: PortService = PortService()
-
     try:
         if not ports_service.delete(port_id):
             return jsonify({"error": "Port nie został znaleziony"}), 404
@@ -2,10 +2,19 @@ from flask import Blueprint, jsonify, request, Response
 from flask_jwt_extended import jwt_required
 
 from app.models.port import Port
-from app.services.portService import PortService
+from app.routes.decorators.errorResponse import error_response
+from app.routes.decorators.jsonResponse import json_response
+from app.routes.decorators.serializer import make_serializer
+from app.routes.ports.schema import CONNECTOR_TYPE_FILTERS, CONNECTOR_TYPE_FILTERS_ERROR, PORT_STATUSES, PORT_STATUSES_ERROR
+from app.services import ports_service, station_service
 
 gets_ports_blueprint: Blueprint = Blueprint("gets_ports", __name__)
 
+_port_item_to_dict = make_serializer(
+    ("id", "station_id", "max_power", "connector_type", "status"),
+    {"max_power": float, "connector_type": str.lower, "status": str.lower}
+)
+
 
 @gets_ports_blueprint.route("/stations/<int:station_id>/ports", methods=["GET"])
 def get_station_ports(station_id) -> tuple[Response, int]:
@@ -31,46 +40,27 @@ def get_station_ports(station_id) -> tuple[Response, int]:
     - ``500`` **Internal Server Error**: Jeśli wystąpił błąd serwera.
     """
 
-    ports_service: PortService = PortService()
-
     try:
-        status: str = request.args.get('status')
-        connector_type: str = request.args.get('connector_type')
-
-        ports: list[Port] = ports_service.get_by_station(station_id)
-        if ports is None:
-            return jsonify({"error": "Stacja nie została znaleziona"}), 404
+        status: str | None = request.args.get('status') or None
+        connector_type: str | None = request.args.get('connector_type') or None
 
+        # Filtry zamieniane są na wartości enuma, więc porty porównywane są bez normalizacji wielkości liter.
         if status:
-            valid_statuses: list[str] = ["available", "inuse", "faulty", "maintenance"]
-            status = status.lower()
-            if status not in valid_statuses:
-                return jsonify({
-                    "error": f"Nieprawidłowy status. Dozwolone wartości: {', '.join(valid_statuses)}"
-                }), 400
-            ports = [p for p in ports if p.status.lower() == status]
+            status = PORT_STATUSES.get(status.lower())
+            if not status:
+                return error_response(PORT_STATUSES_ERROR, 400)
 
         if connector_type:
-            valid_types: list[str] = ["type1", "type2", "ccs", "chademo", "tesla_nacs"]
-            connector_type = connector_type.lower()
-            if connector_type not in valid_types:
-                return jsonify({
-                    "error": f"Nieprawidłowy typ złącza. Dozwolone wartości: {', '.join(valid_types)}"
-                }), 400
-            ports = [p for p in ports if p.connector_type.lower() == connector_type]
+            connector_type = CONNECTOR_TYPE_FILTERS.get(connector_type.lower())
+            if not connector_type:
+                return error_response(CONNECTOR_TYPE_FILTERS_ERROR, 400)
 
-        return jsonify({
-            "items": [
-                {
-                    "id": port.id,
-                    "station_id": port.station_id,
-                    "max_power": float(port.max_power),
-                    "connector_type": port.connector_type.lower(),
-                    "status": port.status.lower()
-                }
-                for port in ports
-            ]
-        }), 200
+        if not station_service.get(station_id):
+            return jsonify({"error": "Stacja nie została znaleziona"}), 404
+
+        ports: list[Port] = ports_service.get_by_station(station_id, status, connector_type)
+
+        return json_response({"items": [_port_item_to_dict(port) for port in ports]})
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -94,8 +84,6 @@ def get_port(port_id) -> tuple[Response, int]:
     - ``500`` **Internal Server Error**: Jeśli wystąpił błąd serwera.
     """
 
-    ports_service: PortService = PortService()
-
     try:
         port: Port = ports_service.get(port_id)
         if not port:
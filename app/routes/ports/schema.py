@@ -0,0 +1,19 @@
+from app.models import CONNECTOR_TYPE, PORT_STATUS
+
+# Typy złączy przyjmowane przy tworzeniu i aktualizacji portu - wartości enuma z bazy danych.
+CONNECTOR_TYPES: frozenset[str] = frozenset(CONNECTOR_TYPE.enums)
+CONNECTOR_TYPES_ERROR: str = f"Nieprawidłowy typ złącza. Dozwolone wartości: {', '.join(CONNECTOR_TYPE.enums)}"
+
+# Typy złączy przyjmowane w filtrze listy portów stacji (małe litery) wraz z odpowiadającą im wartością enuma.
+CONNECTOR_TYPE_FILTERS: dict[str, str] = {
+    "type1": "Type1",
+    "type2": "Type2",
+    "ccs": "CCS",
+    "chademo": "CHAdeMO",
+    "tesla_nacs": "Tesla NACS"
+}
+CONNECTOR_TYPE_FILTERS_ERROR: str = "Nieprawidłowy typ złącza. Dozwolone wartości: type1, type2, ccs, chademo, tesla_nacs"
+
+# Statusy portu przyjmowane w żądaniach (małe litery) wraz z odpowiadającą im wartością enuma zapisywaną w bazie.
+PORT_STATUSES: dict[str, str] = {status.lower(): status for status in PORT_STATUS.enums}
+PORT_STATUSES_ERROR: str = "Nieprawidłowy status. Dozwolone wartości: available, inuse, faulty, maintenance"
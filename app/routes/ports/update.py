@@ -3,7 +3,9 @@ from flask_jwt_extended import jwt_required
 
 from app.models.port import Port
 from app.routes.decorators.adminRequired import admin_required
-from app.services.portService import PortService
+from app.routes.decorators.errorResponse import error_response
+from app.routes.ports.schema import CONNECTOR_TYPES, CONNECTOR_TYPES_ERROR, PORT_STATUSES, PORT_STATUSES_ERROR
+from app.services import ports_service
 
 update_ports_blueprint: Blueprint = Blueprint("update_ports", __name__)
 
@@ -36,8 +38,6 @@ def update_port(port_id) -> tuple[Response, int]:
     - ``500`` **Internal Server Error**: Jeśli wystąpił błąd serwera.
     """
 
-    ports_service: PortService = PortService()
-
     try:
         data = request.get_json()
         if not data:
@@ -64,22 +64,16 @@ def update_port(port_id) -> tuple[Response, int]:
                 return jsonify({"error": "Nieprawidłowy format mocy"}), 400
 
         if "connector_type" in data:
-            valid_types: list[str] = ["Type1", "Type2", "CCS", "CHAdeMO", "Tesla NACS"]
             connector_type: str = data["connector_type"]
-            if connector_type not in valid_types:
-                return jsonify({
-                    "error": f"Nieprawidłowy typ złącza. Dozwolone wartości: {', '.join(valid_types)}"
-                }), 400
+            if connector_type not in CONNECTOR_TYPES:
+                return error_response(CONNECTOR_TYPES_ERROR, 400)
 
         if "status" in data:
-            valid_statuses: list[str] = ["available", "inuse", "faulty", "maintenance"]
             status: str = data["status"].lower()
-            if status not in valid_statuses:
-                return jsonify({
-                    "error": f"Nieprawidłowy status. Dozwolone wartości: {', '.join(valid_statuses)}"
-                }), 400
+            if status not in PORT_STATUSES:
+                return error_response(PORT_STATUSES_ERROR, 400)
 
-            data["status"] = "InUse" if status.lower() == "inuse" else status.capitalize()
+            data["status"] = PORT_STATUSES[status]
 
         updated_port: Port = ports_service.update(port_id, **data)
         if not updated_port:
@@ -116,8 +110,6 @@ def update_port_status(port_id) -> tuple[Response, int]:
     - ``500`` **Internal Server Error**: Jeśli wystąpił nieoczekiwany błąd podczas aktualizacji statusu.
     """
 
-    ports_service: PortService = PortService()
-
     try:
         data = request.get_json()
         if not data:
@@ -126,14 +118,11 @@ def update_port_status(port_id) -> tuple[Response, int]:
         if "status" not in data or data["status"] is None:
             return jsonify({"error": "Status jest wymagany"}), 400
 
-        valid_statuses: list[str] = ["available", "inuse", "faulty", "maintenance"]
         status: str = data["status"].lower()
-        if status not in valid_statuses:
-            return jsonify({
-                "error": f"Nieprawidłowy status. Dozwolone wartości: {', '.join(valid_statuses)}"
-            }), 400
+        if status not in PORT_STATUSES:
+            return error_response(PORT_STATUSES_ERROR, 400)
 
-        status = "InUse" if status.lower() == "inuse" else status.capitalize()
+        status = PORT_STATUSES[status]
 
         port: Port = ports_service.update_status(port_id, status)
         if not port:
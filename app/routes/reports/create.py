@@ -1,11 +1,13 @@
-from flask import Blueprint, request, jsonify, Response
+from flask import Blueprint, jsonify, Response
 from flask_jwt_extended import jwt_required, get_jwt_identity
 
 from app.models.chargingSession import ChargingSession
 from app.models.transaction import Transaction
 from app.models.user import User
 from app.routes.decorators.adminRequired import admin_required
-from app.services import UsersService, ReportsService, TransactionService, ChargingSessionsService
+from app.routes.decorators.errorResponse import error_response
+from app.routes.decorators.requestJson import load_json
+from app.services import users_service, reports_service, transaction_service, charging_sessions_service
 
 create_reports_blueprint = Blueprint('create_reports', __name__, url_prefix='/reports/create')
 
@@ -32,24 +34,23 @@ def create_own_transactions_report() -> tuple[Response, int]:
     - ``500`` **Internal Server Error**: Jeśli wystąpił błąd serwera.
     """
 
-    users_service: UsersService = UsersService()
-    transactions_service: TransactionService = TransactionService()
-    reports_service: ReportsService = ReportsService()
-
     try:
         user_id: int = int(get_jwt_identity())
         user: User = users_service.get(user_id)
 
         if not user:
-            return jsonify({"error": "Użytkownik nie został znaleziony"}), 404
+            return error_response("Użytkownik nie został znaleziony", 404)
 
-        data = request.get_json()
+        try:
+            data = load_json()
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
 
         required_fields: list[str] = ["from_timestamp", "to_timestamp"]
         validation_errors: dict[str, str] = {}
 
         if not data:
-            return jsonify({"error": "Niepoprawne dane żądania"}), 400
+            return error_response("Niepoprawne dane żądania", 400)
 
         for field in required_fields:
             value = data.get(field, "").strip() if isinstance(data.get(field), str) else data.get(field)
@@ -61,14 +62,14 @@ def create_own_transactions_report() -> tuple[Response, int]:
         if validation_errors:
             return jsonify({"error": validation_errors}), 400
 
-        transactions: list[dict[str, User | Transaction]] = transactions_service.get_between(data["from_timestamp"],
-                                                                                             data["to_timestamp"],
-                                                                                             user_id)
+        transactions: list[dict[str, User | Transaction]] = transaction_service.get_between(data["from_timestamp"],
+                                                                                            data["to_timestamp"],
+                                                                                            user_id)
         report_id: int = reports_service.generate_transactions_report(transactions, data["from_timestamp"],
                                                                       data["to_timestamp"], user_id)
 
         if not report_id:
-            return jsonify({"error": "Nie udało sie wygenerować raportu"}), 400
+            return error_response("Nie udało sie wygenerować raportu", 400)
 
         return jsonify({"report_id": report_id}), 200
     except Exception as e:
@@ -98,19 +99,19 @@ def create_all_transactions_report() -> tuple[Response, int]:
     - ``500`` **Internal Server Error**: Jeśli wystąpił błąd serwera.
     """
 
-    transactions_service: TransactionService = TransactionService()
-    reports_service: ReportsService = ReportsService()
-
     try:
         user_id: int = int(get_jwt_identity())
 
-        data = request.get_json()
+        try:
+            data = load_json()
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
 
         required_fields: list[str] = ["from_timestamp", "to_timestamp"]
         validation_errors: dict[str, str] = {}
 
         if not data:
-            return jsonify({"error": "Niepoprawne dane żądania"}), 400
+            return error_response("Niepoprawne dane żądania", 400)
 
         for field in required_fields:
             value = data.get(field, "").strip() if isinstance(data.get(field), str) else data.get(field)
@@ -122,13 +123,13 @@ def create_all_transactions_report() -> tuple[Response, int]:
         if validation_errors:
             return jsonify({"error": validation_errors}), 400
 
-        transactions: list[dict[str, User | Transaction]] = transactions_service.get_between(data["from_timestamp"],
-                                                                                             data["to_timestamp"])
+        transactions: list[dict[str, User | Transaction]] = transaction_service.get_between(data["from_timestamp"],
+                                                                                            data["to_timestamp"])
         report_id: int = reports_service.generate_transactions_report(transactions, data["from_timestamp"],
                                                                       data["to_timestamp"], user_id)
 
         if not report_id:
-            return jsonify({"error": "Nie udało się wygenerować raportu"}), 400
+            return error_response("Nie udało się wygenerować raportu", 400)
 
         return jsonify({"report_id": report_id}), 200
     except Exception as e:
@@ -157,24 +158,23 @@ def create_own_sessions_report() -> tuple[Response, int]:
     - ``500`` **Internal Server Error**: Jeśli wystąpił błąd serwera.
     """
 
-    users_service: UsersService = UsersService()
-    charging_service: ChargingSessionsService = ChargingSessionsService()
-    reports_service: ReportsService = ReportsService()
-
     try:
         user_id: int = int(get_jwt_identity())
         user: User = users_service.get(user_id)
 
         if not user:
-            return jsonify({"error": "Użytkownik nie został znaleziony"}), 404
+            return error_response("Użytkownik nie został znaleziony", 404)
 
-        data = request.get_json()
+        try:
+            data = load_json()
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
 
         required_fields: list[str] = ["from_timestamp", "to_timestamp"]
         validation_errors: dict[str, str] = {}
 
         if not data:
-            return jsonify({"error": "Niepoprawne dane żądania"}), 400
+            return error_response("Niepoprawne dane żądania", 400)
 
         for field in required_fields:
             value = data.get(field, "").strip() if isinstance(data.get(field), str) else data.get(field)
@@ -186,13 +186,13 @@ def create_own_sessions_report() -> tuple[Response, int]:
         if validation_errors:
             return jsonify({"error": validation_errors}), 400
 
-        sessions: list[dict[str, User | ChargingSession]] = charging_service.get_between(data["from_timestamp"],
-                                                                                         data["to_timestamp"], user_id)
+        sessions: list[dict[str, User | ChargingSession]] = charging_sessions_service.get_between(data["from_timestamp"],
+                                                                                                  data["to_timestamp"], user_id)
         report_id: int = reports_service.generate_sessions_report(sessions, data["from_timestamp"],
                                                                   data["to_timestamp"], user_id)
 
         if not report_id:
-            return jsonify({"error": "Nie udało sie wygenerować raportu"}), 400
+            return error_response("Nie udało sie wygenerować raportu", 400)
 
         return jsonify({"report_id": report_id}), 200
     except Exception as e:
@@ -222,19 +222,20 @@ def create_all_sessions_report() -> tuple[Response, int]:
     - ``500`` **Internal Server Error**: Jeśli wystąpił błąd serwera.
     """
     
-    charging_service: ChargingSessionsService = ChargingSessionsService()
-    reports_service: ReportsService = ReportsService()
 
     try:
         user_id: int = int(get_jwt_identity())
 
-        data = request.get_json()
+        try:
+            data = load_json()
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
 
         required_fields: list[str] = ["from_timestamp", "to_timestamp"]
         validation_errors: dict[str, str] = {}
 
         if not data:
-            return jsonify({"error": "Niepoprawne dane żądania"}), 400
+            return error_response("Niepoprawne dane żądania", 400)
 
         for field in required_fields:
             value = data.get(field, "").strip() if isinstance(data.get(field), str) else data.get(field)
@@ -246,13 +247,13 @@ def create_all_sessions_report() -> tuple[Response, int]:
         if validation_errors:
             return jsonify({"error": validation_errors}), 400
 
-        sessions: list[dict[str, User | ChargingSession]] = charging_service.get_between(data["from_timestamp"],
-                                                                                         data["to_timestamp"])
+        sessions: list[dict[str, User | ChargingSession]] = charging_sessions_service.get_between(data["from_timestamp"],
+                                                                                                  data["to_timestamp"])
         report_id: int = reports_service.generate_sessions_report(sessions, data["from_timestamp"],
                                                                   data["to_timestamp"], user_id)
 
         if not report_id:
-            return jsonify({"error": "Nie udało się wygenerować raportu"}), 400
+            return error_response("Nie udało się wygenerować raportu", 400)
 
         return jsonify({"report_id": report_id}), 200
     except Exception as e:
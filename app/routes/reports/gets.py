@@ -7,10 +7,9 @@ from app.models.chargingSession import ChargingSession
 from app.models.report import Report
 from app.models.user import User
 from app.routes.decorators.adminRequired import admin_required
-from app.services import ChargingSessionsService, TransactionService, UsersService
+from app.services import charging_sessions_service, transaction_service, users_service, reports_service, attachments_service
+from app.routes.decorators.errorResponse import error_response
 from app.routes.decorators.pagination import paginate
-from app.services.reportsService import ReportsService
-from app.services.attachmentService import AttachmentsService
 
 gets_report_blueprint = Blueprint('reports', __name__, url_prefix="/reports")
 
@@ -35,25 +34,21 @@ def get_transactions_report(report_id) -> tuple[Response, int]:
     - ``500`` **Internal Server Error**: Jeśli wystąpił błąd serwera.
     """
 
-    reports_service: ReportsService = ReportsService()
-    users_service: UsersService = UsersService()
-    attachments_service: AttachmentsService = AttachmentsService()
-
     try:
         user_id: int = int(get_jwt_identity())
         user: User = users_service.get(user_id)
         report: Report = reports_service.get(report_id)
 
         if not report:
-            return jsonify({"error": "Raport nie został znaleziony"}), 404
+            return error_response("Raport nie został znaleziony", 404)
 
         if int(report.generated_by) != user_id and user.role != "admin":
-            return jsonify({"error": "Brak dostępu"}), 403
+            return error_response("Brak dostępu", 403)
 
         report_pdf = attachments_service.get_file_path(
             rf"attachments/all/reports/transactions/report_{report.pdf_id}.pdf")
         if not os.path.exists(report_pdf):
-            return jsonify({"error": "Nie znaleziono pliku raportu"}), 404
+            return error_response("Nie znaleziono pliku raportu", 404)
 
         return send_file(report_pdf), 200
     except Exception as e:
@@ -80,24 +75,20 @@ def get_sessions_report(report_id) -> tuple[Response, int]:
     - ``500`` **Internal Server Error**: Jeśli wystąpił błąd serwera.
     """
 
-    reports_service: ReportsService = ReportsService()
-    users_service: UsersService = UsersService()
-    attachments_service: AttachmentsService = AttachmentsService()
-
     try:
         user_id: int = int(get_jwt_identity())
         user: User = users_service.get(user_id)
         report: Report = reports_service.get(report_id)
 
         if not report:
-            return jsonify({"error": "Raport nie został znaleziony"}), 404
+            return error_response("Raport nie został znaleziony", 404)
 
         if int(report.generated_by) != user_id and user.role != "admin":
-            return jsonify({"error": "Brak dostępu"}), 403
+            return error_response("Brak dostępu", 403)
 
         report_pdf = attachments_service.get_file_path(rf"attachments/all/reports/sessions/report_{report.pdf_id}.pdf")
         if not os.path.exists(report_pdf):
-            return jsonify({"error": "Nie znaleziono pliku raportu"}), 404
+            return error_response("Nie znaleziono pliku raportu", 404)
 
         return send_file(report_pdf), 200
     except Exception as e:
@@ -121,8 +112,6 @@ def get_own_reports() -> tuple[Response, int] | list[dict[str, str | int]]:
     - ``500`` **Internal Server Error**: Jeśli wystąpił błąd serwera.
     """
 
-    reports_service: ReportsService = ReportsService()
-
     try:
         user_id: int = int(get_jwt_identity())
         reports: list[Report] = reports_service.get_by_user(user_id)
@@ -156,8 +145,6 @@ def get_all_reports() -> tuple[Response, int] | list[dict[str, str | int]]:
     - ``500`` **Internal Server Error**: Jeśli wystąpił błąd serwera.
     """
 
-    reports_service: ReportsService = ReportsService()
-
     try:
         reports: list[Report] = reports_service.get_all()
 
@@ -192,8 +179,6 @@ def get_peak_hours():
     - ``200`` **OK**: Raport godzin ładowania w formacie JSON.\n
     - ``500`` **Internal Server Error**: Jeśli wystąpił błąd serwera.
     """
-    reports_service: ReportsService = ReportsService()
-    charging_sessions_service: ChargingSessionsService = ChargingSessionsService()
 
     period: str = request.args.get("period")
 
@@ -203,17 +188,17 @@ def get_peak_hours():
     if period == "month":
         last_month: list[dict[str, User | ChargingSession]] = charging_sessions_service.get_last_month()
 
-        peak_hours_month: list = ReportsService.calculate_peak_hours(last_month)
+        peak_hours_month: list = reports_service.calculate_peak_hours(last_month)
 
         return jsonify(reports_service.format_peak_hours(peak_hours_month))
     if period == "24h":
         last_24h_sessions: list[dict[str, User | ChargingSession]] = charging_sessions_service.get_last_24_hours()
 
-        peak_hours_24h: list = ReportsService.calculate_peak_hours(last_24h_sessions)
+        peak_hours_24h: list = reports_service.calculate_peak_hours(last_24h_sessions)
 
         return jsonify(reports_service.format_peak_hours(peak_hours_24h))
 
-    return jsonify({"error": "Błędny parametr"}), 400
+    return error_response("Błędny parametr", 400)
 
 @gets_report_blueprint.route("/turnover", methods=["GET"])
 @jwt_required()
@@ -234,8 +219,6 @@ def get_all_turnover():
 
     """
 
-    transaction_service: TransactionService = TransactionService()
-
     turnover = transaction_service.get_all_turnover()
 
     return jsonify({"turnover": turnover})
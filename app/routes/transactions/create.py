@@ -93,7 +93,7 @@ def create_transaction() -> tuple[Response, int]:
             "user_id": transaction.user_id,
             "car_id": transaction.car_id,
             "station_id": transaction.station_id,
-            "amount": str(transaction.amount),
+            "amount": f"{transaction.amount:.2f}",
             "type": transaction.type,
             "created_on": transaction.created_on
         }), 201
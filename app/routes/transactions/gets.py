@@ -38,7 +38,7 @@ def get_self_all_transactions() -> list[dict[str, str | int]] | tuple[Response,
                 "user_id": transaction.user_id,
                 "car_id": transaction.car_id,
                 "station_id": transaction.station_id,
-                "amount": str(transaction.amount),
+                "amount": f"{transaction.amount:.2f}",
                 "type": transaction.type,
                 "created_on": transaction.created_on
             }
@@ -76,7 +76,7 @@ def get_all_transactions() -> list[dict[str, str | int]] | tuple[Response, int]:
                 "user_id": transaction.user_id,
                 "car_id": transaction.car_id,
                 "station_id": transaction.station_id,
-                "amount": str(transaction.amount),
+                "amount": f"{transaction.amount:.2f}",
                 "type": transaction.type,
                 "created_on": transaction.created_on
             }
@@ -121,7 +121,7 @@ def get_transaction(transaction_id) -> tuple[Response, int]:
         "user_id": transaction.user_id,
         "car_id": transaction.car_id,
         "station_id": transaction.station_id,
-        "amount": str(transaction.amount),
+        "amount": f"{transaction.amount:.2f}",
         "type": transaction.type,
         "created_on": transaction.created_on
     }), 200
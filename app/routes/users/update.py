@@ -3,7 +3,6 @@ from typing import Any
 
 from flask import Blueprint, request, jsonify, Response
 from flask_jwt_extended import jwt_required, get_jwt_identity
-from decimal import Decimal
 from datetime import datetime
 
 from app.models.user import User
@@ -109,10 +108,6 @@ def update_user(user_id) -> tuple[Response, int]:
             old_value = getattr(current_user_data, field, None)
             new_value = user_data[field]
             if old_value != new_value:
-                if isinstance(old_value, Decimal):
-                    old_value = float(old_value)
-                if isinstance(new_value, Decimal):
-                    new_value = float(new_value)
                 if field == "date_of_birth":
                     new_value = new_value.strftime("%Y-%m-%d")
                 changes[field] = new_value
@@ -233,10 +228,6 @@ def update_self() -> tuple[Response, int]:
             old_value = getattr(current_user_data, field, None)
             new_value = user_data[field]
             if old_value != new_value:
-                if isinstance(old_value, Decimal):
-                    old_value = float(old_value)
-                if isinstance(new_value, Decimal):
-                    new_value = float(new_value)
                 if field == "date_of_birth":
                     new_value = new_value.strftime("%Y-%m-%d")
                 changes[field] = new_value
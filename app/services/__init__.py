@@ -20,6 +20,6 @@ station_service = StationService()
 ports_service = PortService()
 reports_service = ReportsService()
 transaction_service = TransactionService()
-discounts_service = DiscountService(),
+discounts_service = DiscountService()
 points_service = PointThresholdService()
 faq_service = FaqService()
@@ -107,7 +107,8 @@ class AttachmentsService(Service):
         finally:
             session.close()
 
-    def get_file_path(self, relative_path):
+    @staticmethod
+    def get_file_path(relative_path):
         """
         Zwraca ścieżkę do pliku na serwerze.
 
@@ -3,6 +3,7 @@ from datetime import datetime, timedelta
 from typing import List
 
 from sqlalchemy import Column, Integer, String, JSON, func, BigInteger
+from app.models import now_ms
 from app.models.auditLog import AuditLog
 from app.models.chargingSession import ChargingSession
 from app.models.station import Station
@@ -35,8 +36,8 @@ class AuditLogsService(Service):
     def _get_columns(self):
         return [
             Column('id', Integer, primary_key=True, autoincrement=True),
-            Column('user_id', Integer, nullable=False),
-            Column('action', String(255), nullable=False),
+            Column('user_id', Integer, nullable=False, index=True),
+            Column('action', String(255), nullable=False, index=True),
             Column('details', JSON, nullable=True),
             Column('created_on', BigInteger, nullable=False, server_default=func.now())
         ]
@@ -89,6 +90,21 @@ class AuditLogsService(Service):
 
         return [log for log in super().get_all() if log.action.lower() == action.lower()]
 
+    def get_by_action_and_user(self, action: str, user_id: int):
+        """
+        Pobiera logi dla podanej akcji i identyfikatora użytkownika.
+
+        Argumenty:
+        - action (str): Akcja.
+        - user_id (int): Identyfikator użytkownika.
+
+        Zwraca:
+        - List[AuditLog]: Lista logów użytkownika dla podanej akcji.
+        """
+
+        action = action.lower()
+        return [log for log in super().get_all() if log.user_id == user_id and log.action.lower() == action]
+
     def log_action(self, user_id: int, action: str, details: dict = None) -> AuditLog:
         """
         Loguje akcje użytkownika.
@@ -102,27 +118,47 @@ class AuditLogsService(Service):
         - AuditLog: Obiekt logu.
         """
 
+        return self.log_actions([{"user_id": user_id, "action": action, "details": details}])[0]
+
+    def log_actions(self, entries: List[dict]) -> List[AuditLog]:
+        """
+        Loguje wiele akcji jednym zapytaniem INSERT, bez tworzenia obiektów ORM w sesji.
+
+        Argumenty:
+        - entries (List[dict]): Lista słowników z kluczami user_id, action oraz opcjonalnie details.
+
+        Zwraca:
+        - List[AuditLog]: Lista utworzonych logów.
+        """
+
+        if not entries:
+            return []
+
         session = self.Session()
         try:
-            next_id = session.query(func.max(AuditLog.id)).scalar() + 1 if session.query(
-                AuditLog.id).count() > 0 else 1
-            new_log = AuditLog(
-                id=next_id,
-                user_id=user_id,
-                action=action,
-                details=details or {},
-                created_on=int(datetime.utcnow().timestamp() * 1000)
-            )
-
-            session.add(new_log)
+            next_id = (session.query(func.max(AuditLog.id)).scalar() or 0) + 1
+            created_on = now_ms()
+            rows = [
+                {
+                    "id": next_id + offset,
+                    "user_id": entry["user_id"],
+                    "action": entry["action"],
+                    "details": entry.get("details") or {},
+                    "created_on": created_on
+                }
+                for offset, entry in enumerate(entries)
+            ]
+
+            session.execute(AuditLog.__table__.insert(), rows)
             session.commit()
-
-            refreshed_log = session.merge(new_log)
-            self.set(refreshed_log.id, refreshed_log)
-            return refreshed_log
         finally:
             session.close()
 
+        logs = [self._row_to_log(row) for row in rows]
+        for log in logs:
+            self.set(log.id, log)
+        return logs
+
     def log_login(self, user_id: int, ip_address: str, user_agent: str, success: bool = True) -> AuditLog:
         """
         Loguje logowanie użytkownika.
@@ -251,9 +287,7 @@ class AuditLogsService(Service):
 
         unused_stations = all_stations - used_stations
 
-        for station_id in unused_stations:
-            self.log_action(
-                user_id=0,
-                action="unused_station",
-                details={"station_id": station_id}
-            )
\ No newline at end of file
+        self.log_actions([
+            {"user_id": 0, "action": "unused_station", "details": {"station_id": station_id}}
+            for station_id in unused_stations
+        ])
\ No newline at end of file
@@ -1,11 +1,61 @@
 import os
+from typing import Iterator
 
 import pymysql
+import pymysql.cursors
 
 from app import db
 
 
 class BackupService:
+    # Liczba wierszy pobieranych z serwera i zapisywanych w jednym poleceniu INSERT.
+    BATCH_SIZE: int = 1000
+
+    @staticmethod
+    def stream_backup() -> Iterator[str]:
+        """Tworzy backup bazy MySQL jako strumień poleceń SQL.
+
+        Połączenie nawiązywane jest od razu, dzięki czemu błędy konfiguracji zgłaszane są przed
+        rozpoczęciem odpowiedzi. Wiersze pobierane są kursorem bez buforowania (SSCursor), porcjami po
+        ``BATCH_SIZE``, więc zużycie pamięci nie zależy od rozmiaru bazy.
+
+        Zwraca:
+        - `Iterator[str]`: Kolejne fragmenty pliku backupu.
+        """
+        url = db.engine.url
+
+        if not str(url).startswith("mysql"):
+            raise ValueError("Nieobsługiwany typ bazy danych.")
+
+        connection = pymysql.connect(
+            host=url.host, user=url.username, password=url.password or "", database=url.database,
+            port=url.port or 3306, cursorclass=pymysql.cursors.SSCursor
+        )
+
+        def generate() -> Iterator[str]:
+            try:
+                with connection.cursor() as cursor:
+                    cursor.execute("SHOW TABLES;")
+                    tables = [table[0] for table in cursor.fetchall()]
+
+                for table in tables:
+                    with connection.cursor() as cursor:
+                        cursor.execute(f"SHOW CREATE TABLE `{table}`;")
+                        create_table_stmt = cursor.fetchone()[1]
+                    yield f"\nDROP TABLE IF EXISTS `{table}`;\n{create_table_stmt};\n\n"
+
+                    with connection.cursor() as cursor:
+                        cursor.execute(f"SELECT * FROM `{table}`;")
+                        columns = ", ".join(desc[0] for desc in cursor.description)
+
+                        while rows := cursor.fetchmany(BackupService.BATCH_SIZE):
+                            values = ",\n".join(connection.escape(tuple(row)) for row in rows)
+                            yield f"INSERT INTO `{table}` ({columns}) VALUES \n{values};\n\n"
+            finally:
+                connection.close()
+
+        return generate()
+
     @staticmethod
     def create_backup():
         """Tworzy backup bazy MySQL.
@@ -15,45 +65,12 @@ class BackupService:
         - `None`: Jeśli wystąpi błąd.
         """
         try:
-            engine_url = str(db.engine.url)
-
             file_path = os.path.join(os.getcwd(), "app", "attachments", "backup.sql")
             os.makedirs(os.path.dirname(file_path), exist_ok=True)
 
-            if not engine_url.startswith("mysql"):
-                raise ValueError("Nieobsługiwany typ bazy danych.")
-
-            user = db.engine.url.username
-            password = db.engine.url.password or ""
-            host = db.engine.url.host
-            port = db.engine.url.port or 3306
-            database = db.engine.url.database
-
-            connection = pymysql.connect(
-                host=host, user=user, password=password, database=database, port=port
-            )
+            with open(file_path, "w", encoding="utf-8") as backup_file:
+                backup_file.writelines(BackupService.stream_backup())
 
-            with connection.cursor() as cursor, open(file_path, "w", encoding="utf-8") as backup_file:
-                cursor.execute("SHOW TABLES;")
-                tables = [table[0] for table in cursor.fetchall()]
-
-                for table in tables:
-                    cursor.execute(f"SHOW CREATE TABLE `{table}`;")
-                    create_table_stmt = cursor.fetchone()[1]
-                    backup_file.write(f"\nDROP TABLE IF EXISTS `{table}`;\n{create_table_stmt};\n\n")
-
-                    cursor.execute(f"SELECT * FROM `{table}`;")
-                    rows = cursor.fetchall()
-
-                    if rows:
-                        columns = [desc[0] for desc in cursor.description]
-                        values = ",\n".join(
-                            str(tuple(row)).replace("None", "NULL") for row in rows
-                        )
-                        insert_stmt = f"INSERT INTO `{table}` ({', '.join(columns)}) VALUES \n{values};\n\n"
-                        backup_file.write(insert_stmt)
-
-            connection.close()
             print(f"[Backup] MySQL database backup saved to {file_path}.")
             return file_path
 
@@ -1,6 +1,5 @@
-from datetime import datetime
-
-from sqlalchemy import Column, Integer, String, Enum, DECIMAL, TIMESTAMP, func, BigInteger
+from sqlalchemy import Column, Integer, String, Enum, DECIMAL, TIMESTAMP, func, BigInteger, update, delete
+from app.models import now_ms
 from app.models.car import Car
 from app import db
 from app.services.service import Service
@@ -37,7 +36,7 @@ class CarsService(Service):
     def _get_columns(self):
         return [
             Column('id', Integer, primary_key=True, autoincrement=True),
-            Column('owner_id', Integer, nullable=False),
+            Column('owner_id', Integer, nullable=False, index=True),
             Column('plate', String(20), nullable=False, unique=True),
             Column('name', String(100), nullable=False),
             Column('battery_capacity', DECIMAL(5, 2), nullable=False),
@@ -80,7 +79,7 @@ class CarsService(Service):
         Zwraca:
             List[Car]: Lista obiektów pojazdów
         """
-        return [car for car in self.get_all() if car.owner_id == owner_id]
+        return [car for car in self.iter_all() if car.owner_id == owner_id]
 
     def plate_exists(self, plate: str) -> bool:
         """
@@ -92,7 +91,7 @@ class CarsService(Service):
         Zwraca:
             bool: True, jeśli pojazd o podanej rejestracji już istnieje, False w przeciwnym przypadku
         """
-        return any(car.plate == plate for car in self.get_all())
+        return any(car.plate == plate for car in self.iter_all())
 
     def create(self, owner_id: int, plate: str, name: str, battery_capacity: float, max_charging_power: float,
                connector_type: str, country_code: str, year: int) -> Car:
@@ -123,7 +122,7 @@ class CarsService(Service):
             connector_type=connector_type,
             country_code=country_code,
             year=year,
-            registered_on=BigInteger().python_type(int(datetime.utcnow().timestamp() * 1000))
+            registered_on=now_ms()
         )
 
         db.session.add(new_car)
@@ -144,16 +143,17 @@ class CarsService(Service):
             Car: Obiekt pojazdu po aktualizacji
         """
 
-        car = db.session.query(Car).get(car_id)
-        if not car:
-            return None
+        values = {key: value for key, value in kwargs.items() if key in Car.__table__.columns}
+        if values:
+            result = db.session.execute(update(Car).where(Car.id == car_id).values(**values))
+            db.session.commit()
+            if result.rowcount == 0:
+                return None
 
-        for key, value in kwargs.items():
-            if hasattr(car, key):
+        car = self.get(car_id)
+        if car:
+            for key, value in values.items():
                 setattr(car, key, value)
-
-        db.session.commit()
-        self.set(car.id, car)
         return car
 
     def delete(self, car_id: int):
@@ -167,10 +167,9 @@ class CarsService(Service):
             bool: True, jeśli pojazd został usunięty, False w przeciwnym przypadku
         """
 
-        car = db.session.query(Car).get(car_id)
-        if car:
-            db.session.delete(car)
-            db.session.commit()
+        result = db.session.execute(delete(Car).where(Car.id == car_id))
+        db.session.commit()
+        if result.rowcount:
             self.clear(car_id)
             return True
         return False
@@ -186,4 +185,17 @@ class CarsService(Service):
             Car: Obiekt pojazdu
         """
 
-        return next((car for car in self.get_all() if car.plate == plate), None)
+        return next((car for car in self.iter_all() if car.plate == plate), None)
+
+    def get_id_by_plate(self, plate: str) -> int | None:
+        """
+        Pobiera ID pojazdu o podanej rejestracji
+
+        Argumenty:
+            plate (str): Rejestracja pojazdu
+
+        Zwraca:
+            int | None: ID pojazdu lub None, jeśli pojazd nie istnieje
+        """
+
+        return next((car.id for car in self.iter_all() if car.plate == plate), None)
@@ -4,6 +4,7 @@ from app import db
 from app.models.user import User
 from app.services.service import Service
 from datetime import datetime
+from operator import attrgetter
 from typing import Optional
 from threading import Timer
 from app.services.portService import PortService
@@ -99,6 +100,34 @@ class ChargingSessionsService(Service):
         """
         return [session for session in super().get_all() if session.user_id == user_id]
 
+    def get_last_completed(self, user_id: int) -> Optional[ChargingSession]:
+        """
+        Pobiera ostatnią zakończoną sesję ładowania użytkownika.
+
+        Argumenty:
+            user_id (int): Identyfikator użytkownika.
+
+        Zwraca:
+            ChargingSession | None: Sesja z najpóźniejszym czasem zakończenia lub None, jeśli brak zakończonych sesji.
+        """
+        return max(
+            (session for session in self.iter_all() if session.user_id == user_id and session.end_on is not None),
+            key=attrgetter('end_on'),
+            default=None
+        )
+
+    def has_sessions(self, user_id: int) -> bool:
+        """
+        Sprawdza, czy użytkownik ma jakąkolwiek sesję ładowania.
+
+        Argumenty:
+            user_id (int): Identyfikator użytkownika.
+
+        Zwraca:
+            bool: True, jeśli użytkownik ma co najmniej jedną sesję ładowania.
+        """
+        return any(session.user_id == user_id for session in self.iter_all())
+
     def get_active_sessions(self):
         """
         Pobiera informacje o aktywnych sesjach ładowania.
@@ -15,6 +15,11 @@ class DiscountStatus(Enum):
 
 
 class DiscountService(Service):
+    # Indeks kod (małe litery) -> ID zniżki, wspólny dla wszystkich instancji serwisu. Budowany raz po wczytaniu
+    # cache i aktualizowany przy tworzeniu, edycji i usuwaniu zniżek, więc jest źródłem prawdy dla get_by_code.
+    _code_index: dict[str, int] = {}
+    _code_index_loaded: bool = False
+
     def __init__(self):
         """
         Konstruktor klasy DiscountService, który inicjalizuje klasę bazową Service.
@@ -28,6 +33,10 @@ class DiscountService(Service):
         )
         self.DiscountStatus = DiscountStatus
 
+        if not DiscountService._code_index_loaded:
+            DiscountService._code_index.update((d.code.lower(), d.id) for d in self.get_all())
+            DiscountService._code_index_loaded = True
+
     def _row_to_discount(self, row: dict) -> Discount:
         return Discount(
             id=row["id"],
@@ -79,7 +88,8 @@ class DiscountService(Service):
         Zwraca:
             Discount: Obiekt zniżki lub None, jeśli zniżka nie została znaleziona.
         """
-        return next((d for d in super().get_all() if d.code.lower() == code.lower()), None)
+        discount_id = DiscountService._code_index.get(code.lower())
+        return self.get(discount_id) if discount_id is not None else None
 
     def create_discount(self, code: str, value: float, expiry_on: int = None, max_uses: int = None) -> Discount:
         """
@@ -111,6 +121,7 @@ class DiscountService(Service):
             db.session.commit()
 
             self.set(next_id, new_discount)
+            DiscountService._code_index[code.lower()] = next_id
             return new_discount
         except Exception as e:
             db.session.rollback()
@@ -131,10 +142,13 @@ class DiscountService(Service):
             if not discount:
                 return False
 
+            code: str = discount.code
+
             db.session.delete(discount)
             db.session.commit()
 
             self.clear(discount_id)
+            DiscountService._code_index.pop(code.lower(), None)
             return True
         except Exception as e:
             db.session.rollback()
@@ -157,6 +171,8 @@ class DiscountService(Service):
             if not discount:
                 return None
 
+            old_code: str = discount.code
+
             for key, value in kwargs.items():
                 if hasattr(discount, key):
                     setattr(discount, key, value)
@@ -165,6 +181,8 @@ class DiscountService(Service):
 
             refreshed_discount = session.merge(discount)
             self.set(refreshed_discount.id, refreshed_discount)
+            DiscountService._code_index.pop(old_code.lower(), None)
+            DiscountService._code_index[refreshed_discount.code.lower()] = refreshed_discount.id
             return refreshed_discount
         finally:
             session.close()
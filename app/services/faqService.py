@@ -1,4 +1,5 @@
 from datetime import datetime
+from operator import attrgetter
 
 from sqlalchemy import Column, Integer, String, BigInteger, func, ForeignKey, Boolean, Text
 
@@ -6,6 +7,11 @@ from app import db
 from app.models.faq import Faq
 from app.services.service import Service
 
+FAQ_FIELDS: tuple[str, ...] = ("id", "question", "answer", "public", "user_id", "created_on")
+_faq_values: attrgetter = attrgetter(*FAQ_FIELDS)
+FAQ_WRITE_FIELDS: tuple[str, ...] = ("id", "question", "answer", "public")
+_faq_write_values: attrgetter = attrgetter(*FAQ_WRITE_FIELDS)
+
 
 class FaqService(Service):
     def __init__(self):
@@ -36,7 +42,7 @@ class FaqService(Service):
             Column('question', Text, nullable=False),
             Column('answer', Text, nullable=False),
             Column('public', Boolean, nullable=False, default=False),
-            Column('user_id', Integer, ForeignKey('users.id'), nullable=False),
+            Column('user_id', Integer, ForeignKey('users.id'), nullable=False, index=True),
             Column('created_on', BigInteger, nullable=False, server_default=func.now())
         ]
 
@@ -71,7 +77,23 @@ class FaqService(Service):
         Zwraca:
             list[Faq]: Lista FAQ
         """
-        return [faq for faq in super().get_all() if faq.question.lower() == question.lower()]
+        question = question.lower()
+        return [faq for faq in self.iter_all() if faq.question.lower() == question]
+
+    def question_exists(self, question: str) -> bool:
+        """
+        Sprawdza, czy istnieje FAQ o podanej treści pytania (bez rozróżniania wielkości liter).
+
+        Przeszukiwanie kończy się na pierwszym dopasowaniu.
+
+        Argumenty:
+            question (str): Treść pytania.
+
+        Zwraca:
+            bool: True jeśli pytanie istnieje, False w przeciwnym razie
+        """
+        question = question.lower()
+        return any(faq.question.lower() == question for faq in self.iter_all())
 
     def get_by_answer(self, answer: str):
         """
@@ -95,7 +117,7 @@ class FaqService(Service):
         Zwraca:
             list[Faq]: Lista FAQ
         """
-        return [faq for faq in super().get_all() if faq.user_id == user_id]
+        return [faq for faq in self.iter_all() if faq.user_id == user_id]
 
     def create(self, user_id: int, question: str, answer: str, public: bool = False):
         """
@@ -321,11 +343,16 @@ class FaqService(Service):
         Zwraca:
             dict: Słownik z informacjami o FAQ
         """
-        return {
-            "id": faq.id,
-            "question": faq.question,
-            "answer": faq.answer,
-            "public": faq.public,
-            "user_id": faq.user_id,
-            "created_on": faq.created_on
-        }
\ No newline at end of file
+        return dict(zip(FAQ_FIELDS, _faq_values(faq)))
+
+    def to_minimal_dict(self, faq: Faq):
+        """
+        Metoda pomocnicza, która konwertuje obiekt FAQ do słownika zawierającego tylko pola zwracane po zapisie.
+
+        Argumenty:
+            faq (Faq): Obiekt FAQ.
+
+        Zwraca:
+            dict: Słownik z ID, pytaniem, odpowiedzią i informacją o publikacji FAQ
+        """
+        return dict(zip(FAQ_WRITE_FIELDS, _faq_write_values(faq)))
\ No newline at end of file
@@ -59,17 +59,26 @@ class PortService(Service):
         """
         return super().get_all()
 
-    def get_by_station(self, station_id: int):
+    def get_by_station(self, station_id: int, status: str | None = None, connector_type: str | None = None):
         """
-        Metoda zwracająca porty dla danej stacji.
+        Metoda zwracająca porty dla danej stacji, opcjonalnie zawężone do statusu i typu złącza.
+
+        Filtry sprawdzane są w jednym przejściu po portach.
 
         Argumenty:
             station_id (int): Identyfikator stacji.
+            status (str, opcjonalnie): Status portu - wartość enuma ``port_status`` (np. "InUse").
+            connector_type (str, opcjonalnie): Typ złącza - wartość enuma ``connector_types`` (np. "Tesla NACS").
 
         Zwraca:
             list: Lista obiektów portów dla danej stacji.
         """
-        return [port for port in self.get_all() if port.station_id == station_id]
+        return [
+            port for port in self.iter_all()
+            if port.station_id == station_id
+            and (status is None or port.status == status)
+            and (connector_type is None or port.connector_type == connector_type)
+        ]
 
     def get_available_ports(self):
         """
@@ -40,7 +40,7 @@ class ReportsService(Service):
     def _get_columns(self):
         return [
             Column('id', Integer, primary_key=True, autoincrement=True),
-            Column('generated_by', Integer, ForeignKey('users.id'), nullable=False),
+            Column('generated_by', Integer, ForeignKey('users.id'), nullable=False, index=True),
             Column('type', Enum('Usage', 'Cost', 'Statistics', 'Invoice', name='report_types'), nullable=False),
             Column('generated_on', BigInteger, nullable=False, server_default=func.now()),
             Column('pdf_id', Integer, nullable=False)
@@ -89,7 +89,26 @@ class ReportsService(Service):
         Zwraca:
         - List[Report]: Lista obiektów raportów o podanym typie.
         """
-        return [report for report in self.get_all() if report.type.lower() == report_type.lower()]
+        report_type = report_type.lower()
+        return [report for report in self.iter_all() if report.type.lower() == report_type]
+
+    def get_invoices(self, user_id: int | None = None) -> list[Report]:
+        """
+        Pobiera faktury, opcjonalnie tylko te wygenerowane przez podanego użytkownika.
+
+        Typ raportu jest wartością enuma ``report_types``, więc porównywany jest bezpośrednio,
+        bez normalizacji wielkości liter dla każdego wiersza.
+
+        Argumenty:
+        - user_id (int | None): Identyfikator użytkownika. Domyślnie None (wszystkie faktury).
+
+        Zwraca:
+        - List[Report]: Lista faktur.
+        """
+        if user_id is None:
+            return [report for report in self.iter_all() if report.type == "Invoice"]
+
+        return [report for report in self.iter_all() if report.generated_by == user_id and report.type == "Invoice"]
 
     def create_report(self, generated_by: int, report_type: str) -> Report | None:
         """
@@ -283,8 +302,8 @@ class ReportsService(Service):
                 row.cell(c.plate)
                 row.cell(start_date)
                 row.cell(end_date)
-                row.cell(str(s.energy_consumed))
-                row.cell(str(s.cost))
+                row.cell(f"{s.energy_consumed:.2f}")
+                row.cell(f"{s.cost:.2f}")
 
                 total_energy += s.energy_consumed
                 total_cost += s.cost
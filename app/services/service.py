@@ -1,4 +1,4 @@
-from sqlalchemy import MetaData, Table, Column, Integer, select, inspect
+from sqlalchemy import MetaData, Table, Column, Integer, Numeric, select, inspect
 from sqlalchemy.orm import sessionmaker
 from typing import Callable, Dict, Any
 from app import db
@@ -32,6 +32,11 @@ class Service:
                     print(f"[Error] Failed to create table {self._table_name}: {e}")
             self.table = Table(self._table_name, self.metadata, autoload_with=db.engine)
 
+            # Kolumny DECIMAL są wczytywane jako float - bez tworzenia obiektów Decimal dla każdego wiersza.
+            for column in self.table.columns:
+                if isinstance(column.type, Numeric):
+                    column.type.asdecimal = False
+
         self.Session = sessionmaker(bind=db.engine)
 
         if self._table_name not in Service._global_cache:
@@ -133,6 +138,19 @@ class Service:
         """
         return list(Service._global_cache[self._table_name].values())
 
+    def iter_all(self):
+        """
+        Metoda do iterowania po obiektach z cache.
+
+        Zwraca migawkę wartości kopiowaną w C jednym wywołaniem ``tuple`` - iteracja po niej w Pythonie
+        (generatory, wyrażenia listowe) jest bezpieczna przy równoczesnych zmianach cache z innych wątków,
+        w przeciwieństwie do żywego widoku ``dict.values()``.
+
+        Zwraca:
+            tuple[Any, ...]: Obiekty z cache.
+        """
+        return tuple(Service._global_cache[self._table_name].values())
+
     @staticmethod
     def cache_get(key):
         """
@@ -429,7 +429,9 @@ class UsersService(Service):
 
     def add_points(self, user_id: int, points: int) -> bool:
         """
-        Dodaje punkty do konta użytkownika
+        Dodaje punkty do konta użytkownika
+
+        Punkty dodawane są jednym UPDATE po stronie bazy danych, więc równoległe zmiany salda nie nadpisują się nawzajem.
 
         Argumenty:
             user_id (int): ID użytkownika.
@@ -440,17 +442,15 @@ class UsersService(Service):
         """
         session = self.Session()
         try:
-            user = session.query(User).get(user_id)
-            if not user:
+            updated: int = session.query(User).filter(User.id == user_id).update(
+                {User.points: func.coalesce(User.points, 0) + points}, synchronize_session=False)
+            if updated != 1:
+                session.rollback()
                 return False
 
-            if user.points is None:
-                user.points = 0
-
-            user.points += points
             session.commit()
 
-            refreshed_user = session.merge(user)
+            refreshed_user = session.get(User, user_id)
             self.set(refreshed_user.id, refreshed_user)
             return True
         except Exception as e:
@@ -462,25 +462,29 @@ class UsersService(Service):
 
     def deduct_points(self, user_id: int, points: int) -> bool:
         """
-        Odejmuje punkty z konta użytkownika
+        Odejmuje punkty z konta użytkownika
+
+        Sprawdzenie salda i odjęcie punktów wykonywane są jednym warunkowym UPDATE, więc równoległe
+        żądania nie mogą wydać tych samych punktów dwukrotnie.
 
         Argumenty:
             user_id (int): ID użytkownika.
             points (int): Ilość punktów do odejmowania.
 
         Zwraca:
-            bool: True jeśli punkty zostały odejmowane, False jeśli użytkownik nie został znaleziony
+            bool: True jeśli punkty zostały odejmowane, False jeśli użytkownik nie został znaleziony lub ma za mało punktów
         """
         session = self.Session()
         try:
-            user = session.query(User).get(user_id)
-            if not user or user.points < points:
+            updated: int = session.query(User).filter(User.id == user_id, User.points >= points).update(
+                {User.points: User.points - points}, synchronize_session=False)
+            if updated != 1:
+                session.rollback()
                 return False
-            
-            user.points -= points
+
             session.commit()
-            
-            refreshed_user = session.merge(user)
+
+            refreshed_user = session.get(User, user_id)
             self.set(refreshed_user.id, refreshed_user)
             return True
         except Exception as e: